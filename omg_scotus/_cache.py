@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+# Downloaded court PDFs are kept on disk so repeated runs skip the network.
+# The Court occasionally replaces a PDF at the same URL (corrected slip
+# opinions, reissued order lists), so entries expire after CACHE_MAX_AGE.
+CACHE_DIR = Path(
+    os.environ.get(
+        'OMG_SCOTUS_CACHE_DIR',
+        Path.home() / '.cache' / 'omg_scotus',
+    ),
+)
+# Set OMG_SCOTUS_NO_CACHE to any non-empty value to disable the cache.
+CACHE_ENABLED = not os.environ.get('OMG_SCOTUS_NO_CACHE')
+CACHE_MAX_AGE = 24 * 60 * 60
+# Oldest entries are evicted once the cache grows past this many bytes.
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def get_cache_path(url: str) -> Path:
+    """Return the cache file path for url."""
+    return CACHE_DIR / f'{hashlib.sha256(url.encode()).hexdigest()}.pdf'
+
+
+def read_cached_pdf(url: str) -> bytes | None:
+    """Return the cached bytes of the PDF at url, or None on a miss.
+
+    Entries older than CACHE_MAX_AGE are removed and count as a miss.
+    """
+    if not CACHE_ENABLED:
+        return None
+    path = get_cache_path(url)
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_MAX_AGE:
+            path.unlink()
+            return None
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def write_cached_pdf(url: str, data: bytes | memoryview) -> None:
+    """Cache the bytes of the PDF at url.
+
+    The file is written under a temporary name and renamed into place so
+    that concurrent readers never see a partial PDF. Failing to write the
+    cache (e.g. a read-only home directory) is not an error.
+    """
+    if not CACHE_ENABLED:
+        return
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, get_cache_path(url))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        evict_cached_pdfs()
+    except OSError:
+        pass
+
+
+def evict_cached_pdfs() -> None:
+    """Remove the oldest cached PDFs until the cache fits CACHE_MAX_BYTES."""
+    entries = []
+    for path in CACHE_DIR.glob('*.pdf'):
+        try:
+            stat = path.stat()
+        except OSError:  # removed by another process
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= CACHE_MAX_BYTES:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
@@ -16,25 +16,31 @@ class OrderSectionType(Enum):
 
     @staticmethod
     def from_string(label: str) -> OrderSectionType:
-        if label in (
-            'CERTIORARI -- SUMMARY DISPOSITIONS',
-            'CERTIORARI -- SUMMARY DISPOSITION',
-        ):
-            return OrderSectionType.CERTIORARI_SUMMARY_DISPOSITIONS
-        elif label in ('ORDERS IN PENDING CASES', 'ORDER IN PENDING CASE'):
-            return OrderSectionType.ORDERS_IN_PENDING_CASES
-        elif label == 'CERTIORARI GRANTED':
-            return OrderSectionType.CERTIORARI_GRANTED
-        elif label == 'CERTIORARI DENIED':
-            return OrderSectionType.CERTIORARI_DENIED
-        elif label == 'HABEAS CORPUS DENIED':
-            return OrderSectionType.HABEAS_CORPUS_DENIED
-        elif label == 'MANDAMUS DENIED':
-            return OrderSectionType.MANDAMUS_DENIED
-        elif label in ('REHEARINGS DENIED', 'REHEARING DENIED'):
-            return OrderSectionType.REHEARINGS_DENIED
-        else:
-            raise NotImplementedError
+        label = label.strip().upper()
+        if label not in _SECTION_LABELS:
+            raise NotImplementedError(
+                f'String {label} not recognized as an order section.',
+            )
+        return _SECTION_LABELS[label]
+
+
+# built once rather than on every from_string call
+_SECTION_LABELS: dict[str, OrderSectionType] = {
+    'CERTIORARI -- SUMMARY DISPOSITIONS': (
+        OrderSectionType.CERTIORARI_SUMMARY_DISPOSITIONS
+    ),
+    'CERTIORARI -- SUMMARY DISPOSITION': (
+        OrderSectionType.CERTIORARI_SUMMARY_DISPOSITIONS
+    ),
+    'ORDERS IN PENDING CASES': OrderSectionType.ORDERS_IN_PENDING_CASES,
+    'ORDER IN PENDING CASE': OrderSectionType.ORDERS_IN_PENDING_CASES,
+    'CERTIORARI GRANTED': OrderSectionType.CERTIORARI_GRANTED,
+    'CERTIORARI DENIED': OrderSectionType.CERTIORARI_DENIED,
+    'HABEAS CORPUS DENIED': OrderSectionType.HABEAS_CORPUS_DENIED,
+    'MANDAMUS DENIED': OrderSectionType.MANDAMUS_DENIED,
+    'REHEARINGS DENIED': OrderSectionType.REHEARINGS_DENIED,
+    'REHEARING DENIED': OrderSectionType.REHEARINGS_DENIED,
+}
 
 
 class RulesType(Enum):
@@ -44,13 +50,6 @@ class RulesType(Enum):
     RULES_OF_CRIMINAL_PROCEDURE = auto()
 
 
-class OrderType(Enum):
-    ORDER_LIST = auto()
-    MISCELLANEOUS_ORDER = auto()
-    STAY_ORDER = auto()
-    RULES_ORDER = auto()
-
-
 class DocumentType(Enum):
     ORDER_LIST = auto()
     MISCELLANEOUS_ORDER = auto()
@@ -1,5 +1,9 @@
+from __future__ import annotations
+
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Any
 
 import spacy
 from spacy.language import Language
@@ -7,6 +11,7 @@ from spacy.language import Language
 from omg_scotus.fetcher import Fetcher
 from omg_scotus.fetcher import Stream
 from omg_scotus.helpers import get_term_year
+from omg_scotus.helpers import NLP_DISABLED_PIPES
 from omg_scotus.justice import create_court
 from omg_scotus.parser import Parser
 
@@ -15,41 +20,59 @@ def add_custom_rules_to_nlp(nlp: Language) -> None:
     # Add custom rules to nlp
     ruler = nlp.get_pipe('attribute_ruler')
 
-    justices = (
+    justices = [
         str.upper(justice.last_name)
         for justice in create_court(current=True)
-    )
-
-    patterns = [
-        [{'TEXT': justice}] for justice in justices
     ]
+
+    # one set-membership pattern instead of one pattern per justice
+    patterns = [[{'TEXT': {'IN': justices}}]]
     attrs = {'DEP': 'nsubj'}
     ruler.add(patterns=patterns, attrs=attrs)
 
 
+def fetch_term_payloads(term_year: str) -> list[dict[str, Any]]:
+    """Download all slip opinion payloads for a term."""
+    print(f'Preparing download for {term_year=}')
+    return Fetcher(Stream.SLIP_OPINIONS, term_year=term_year).get_payload()
+
+
+def parse_term_payloads(
+    payloads: list[dict[str, Any]], nlp: Language,
+) -> list[Any]:
+    """Parse a term's payloads into release objects."""
+    docs = []
+    for i, payload in enumerate(payloads):
+        doc = Parser(payload, nlp).get_object()
+        print(f'Appended {i+1}/{len(payloads)} docs.')
+        docs.append(doc)
+    return docs
+
+
 def main() -> int:
 
-    nlp = spacy.load('en_core_web_lg')
+    # authorship only reads sentences, dependencies and POS tags
+    nlp = spacy.load('en_core_web_lg', disable=NLP_DISABLED_PIPES)
     add_custom_rules_to_nlp(nlp)
     retv = {}
     # scotus dockets start in 2003
-    for term_year in range(
-        11,
-        int(get_term_year(datetime.today().date())) + 1,
-    ):
-        docs = []
-        t_year = str(term_year).zfill(2)
-        print(f'Preparing download for {term_year=}')
-        payloads = Fetcher(
-            Stream.SLIP_OPINIONS,
-            term_year=t_year,
-        ).get_payload()
-        for i, payload in enumerate(payloads):
-            doc = Parser(payload, nlp).get_object()
-            print(f'Appended {i+1}/{len(payloads)} docs.')
-            docs.append(doc)
-        retv[t_year] = docs
-        print(f'Term year {t_year} finished')
+    term_years = [
+        str(term_year).zfill(2) for term_year in range(
+            11,
+            int(get_term_year(datetime.today().date())) + 1,
+        )
+    ]
+    # download the next term in the background while this one is parsed
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        next_payloads = executor.submit(fetch_term_payloads, term_years[0])
+        for term_idx, t_year in enumerate(term_years):
+            payloads = next_payloads.result()
+            if term_idx + 1 < len(term_years):
+                next_payloads = executor.submit(
+                    fetch_term_payloads, term_years[term_idx + 1],
+                )
+            retv[t_year] = parse_term_payloads(payloads, nlp)
+            print(f'Term year {t_year} finished')
 
     with open('data/all_opinions.pkl', 'wb') as handle:
         pickle.dump(retv, handle, protocol=pickle.HIGHEST_PROTOCOL)
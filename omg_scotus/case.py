@@ -10,6 +10,7 @@ class CaseType(Enum):
 
 
 class Case:
+    __slots__ = ('number', 'name', 'type', 'parties')
     number: str
     name: str
     type: CaseType
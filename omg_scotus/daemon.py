@@ -1,22 +1,23 @@
-import threading
+import asyncio
 
 from omg_scotus.fetcher import Stream
 from omg_scotus.website_change_detector import ChangeDetector
 
 
-def main() -> int:
+async def detect_changes() -> None:
     cd1 = ChangeDetector(stream=Stream.SLIP_OPINIONS)
     cd2 = ChangeDetector(stream=Stream.OPINIONS_RELATING_TO_ORDERS)
     cd3 = ChangeDetector(stream=Stream.ORDERS)
 
-    thread1 = threading.Thread(target=cd1.start_detection)
-    thread2 = threading.Thread(target=cd2.start_detection)
-    thread3 = threading.Thread(target=cd3.start_detection)
+    await asyncio.gather(
+        cd1.start_detection(),
+        cd2.start_detection(),
+        cd3.start_detection(),
+    )
 
-    thread1.start()
-    thread2.start()
-    thread3.start()
 
+def main() -> int:
+    asyncio.run(detect_changes())
     return 0
 
 
@@ -1,28 +1,102 @@
 from __future__ import annotations
 
-import json
 import re
+import threading
+import time
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import auto
 from enum import Enum
+from functools import lru_cache
 from json import JSONDecodeError
 from typing import Any
+from typing import TYPE_CHECKING
 
-import bs4
-import pandas as pd
-import pdfplumber
-import requests
-from bs4 import BeautifulSoup
-from spacy import Language
+try:
+    # orjson parses bytes directly and raises a json.JSONDecodeError subclass
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
 
 from omg_scotus.helpers import create_docket_number
+from omg_scotus.helpers import get_conditional_headers
 from omg_scotus.helpers import get_term_year
+from omg_scotus.helpers import make_soup
 from omg_scotus.helpers import read_pdf
 from omg_scotus.helpers import remove_extra_whitespace
+from omg_scotus.helpers import REQUEST_TIMEOUT
 from omg_scotus.helpers import require_non_none
-from omg_scotus.helpers import suffix_base_url
+from omg_scotus.helpers import SESSION
+
+if TYPE_CHECKING:
+    # only needed for annotations; pandas is imported on first use
+    import bs4
+    import pandas as pd
+    import pdfplumber
+    from bs4 import BeautifulSoup
+
+_SCOTUS_ROOT = 'https://www.supremecourt.gov'
+_DISPOSITION_RE = re.compile(r'AFFIRMED|DISMISSED|REMANDED|REVERSED|VACATED')
+# parenthetical after a docket number, e.g. '22O141 (Orig.)'
+_DOCKET_PAREN_RE = re.compile(r'\s\(.+\)')
+
+# PDF downloads are I/O bound, so a handful of threads hides most latency.
+MAX_DOWNLOAD_WORKERS = 8
+# How long a parsed index page is reused before it is revalidated.
+SOUP_CACHE_TTL = 5 * 60
+
+# base_url -> (time fetched, parsed page, revalidation headers), shared by
+# all strategies
+_SOUP_CACHE: dict[
+    str, tuple[float, bs4.BeautifulSoup, dict[str, str]],
+] = {}
+_SOUP_CACHE_LOCK = threading.Lock()
+
+
+def clear_soup_cache() -> None:
+    """Forget all cached index pages, forcing the next fetch to download."""
+    with _SOUP_CACHE_LOCK:
+        _SOUP_CACHE.clear()
+
+
+def _parse_mdy(mdy: str) -> datetime:
+    """Parse a court listing date, e.g. '6/30/22'.
+
+    Listing dates are always this century, so this avoids strptime's
+    per-call format parsing.
+    """
+    month, day, year = mdy.split('/')
+    return datetime(2000 + int(year), int(month), int(day))
+
+
+def _mdy_to_ymd(mdy: str) -> str:
+    """Convert a court listing date, e.g. '6/30/22', to '2022-06-30'."""
+    return _parse_mdy(mdy).date().isoformat()
+
+
+@lru_cache(maxsize=128)
+def _get_term_year_from_url(url: str) -> str:
+    """Return the Term year a court document URL belongs to."""
+    parts = url.split('/')
+    file_name = parts[-1]
+    if file_name.startswith('fr'):
+        # frbk22 -> 22 - 1
+        return str(int(file_name[4:6]) - 1)
+    elif parts[-3] == 'opinions':
+        return parts[-2][:2]
+    elif parts[-3] == 'orders':
+        # order list file names start with the date, e.g. 100322zor
+        mmddyy = file_name[:6]
+        return get_term_year(
+            datetime(
+                2000 + int(mmddyy[4:]), int(mmddyy[:2]), int(mmddyy[2:4]),
+            ).date(),
+        )
+    else:
+        raise NotImplementedError
 
 
 class Stream(Enum):
@@ -34,6 +108,10 @@ class Stream(Enum):
 
 class FetcherStrategy(ABC):
     """Strategy to be used by Fetcher class."""
+    __slots__ = (
+        'stream', 'most_recent', 'date', 'term_year', 'url', 'base_url',
+        'soup',
+    )
     stream: Stream
     most_recent: bool
     date: str | None
@@ -62,11 +140,11 @@ class FetcherStrategy(ABC):
     def set_base_url(self) -> str:
         """Set base URL from which to find Opinion."""
         if self.stream is Stream.ORDERS:
-            href = 'https://www.supremecourt.gov/orders/ordersofthecourt/'
+            href = f'{_SCOTUS_ROOT}/orders/ordersofthecourt/'
         elif self.stream is Stream.OPINIONS_RELATING_TO_ORDERS:
-            href = 'https://www.supremecourt.gov/opinions/relatingtoorders/'
+            href = f'{_SCOTUS_ROOT}/opinions/relatingtoorders/'
         elif self.stream is Stream.SLIP_OPINIONS:
-            href = 'https://www.supremecourt.gov/opinions/slipopinion/'
+            href = f'{_SCOTUS_ROOT}/opinions/slipopinion/'
         else:
             raise NotImplementedError
         return f'{href}{self.get_term_for_url()}'
@@ -78,30 +156,52 @@ class FetcherStrategy(ABC):
         elif not self.url:
             # We are grabbing most recent date, so get today's Term.
             term_year = get_term_year(datetime.today().date())
-        elif self.url.split('/')[-1].startswith('fr'):
-            # frbk22 -> 22 - 1
-            term_year = str(int(self.url.split('/')[-1][4:6]) - 1)
-        elif self.url.split('/')[-3] == 'opinions':
-            term_year = self.url.split('/')[-2][:2]
-        elif self.url.split('/')[-3] == 'orders':
-            url_date = self.url.split('/')[-1][:6]
-            term_year = get_term_year(
-                datetime.strptime(url_date, '%m%d%y').date(),
-            )
         else:
-            raise NotImplementedError
+            term_year = _get_term_year_from_url(self.url)
         return term_year
 
     def get_soup(self) -> bs4.BeautifulSoup:
-        """Get BeautifulSoup object."""
-        headers = {
-            'User-Agent': (
-                'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:50.0)'
-                'Gecko/20100101 Firefox/50.0'
-            ),
-        }
-        payload = requests.get(self.base_url, headers=headers)
-        return BeautifulSoup(payload.text, 'html.parser')
+        """Get BeautifulSoup object, reusing a recent parse of the page.
+
+        Once a cached parse is older than SOUP_CACHE_TTL, the page is
+        requested conditionally and the old parse is kept on a 304.
+        """
+        with _SOUP_CACHE_LOCK:
+            cached = _SOUP_CACHE.get(self.base_url)
+        validators: dict[str, str] = {}
+        if cached is not None:
+            fetched_at, soup, validators = cached
+            if time.monotonic() - fetched_at < SOUP_CACHE_TTL:
+                return soup
+        new_soup, validators = self.download_soup(validators)
+        if new_soup is not None:
+            soup = new_soup
+        with _SOUP_CACHE_LOCK:
+            _SOUP_CACHE[self.base_url] = (time.monotonic(), soup, validators)
+        return soup
+
+    def download_soup(
+        self, validators: dict[str, str],
+    ) -> tuple[bs4.BeautifulSoup | None, dict[str, str]]:
+        """Download and parse the index page at base_url.
+
+        Return the parsed page (None if the server reports it unchanged
+        since validators were issued) and the validators to send next.
+        """
+        # the session already sends the User-Agent the court site expects
+        payload = SESSION.get(
+            self.base_url, headers=validators, timeout=REQUEST_TIMEOUT,
+        )
+        if payload.status_code == 304:
+            return None, validators
+        return (
+            make_soup(payload.content, parse_only=self.get_strainer()),
+            get_conditional_headers(payload),
+        )
+
+    def get_strainer(self) -> bs4.SoupStrainer | None:
+        """Return filter for the elements of the page to parse, if any."""
+        return None
 
     @abstractmethod
     def get_contents(self) -> BeautifulSoup.contents: pass
@@ -112,81 +212,64 @@ class FetcherStrategy(ABC):
 
 
 class OrdersFetcherStrategy(FetcherStrategy):
+    __slots__ = ()
 
     def get_contents(self) -> BeautifulSoup.contents:
         if self.url:
-            match: BeautifulSoup.contents = require_non_none(
-                self.soup.find_all(
-                    attrs={
-                        'href': require_non_none(self.url).replace(
-                            'https://www.supremecourt.gov',
-                            '',
-                        ),
-                    },
-                ),
-            )
+            href = self.url.removeprefix(_SCOTUS_ROOT)
+            # only the first link to the order is used, so stop the tree
+            # walk there instead of collecting every match
+            match: BeautifulSoup.contents = [
+                require_non_none(self.soup.find(attrs={'href': href})),
+            ]
         else:
-            match = self.soup.find_all(
+            match = self.soup.find(
                 'div', class_='column2',
-            )[0].contents[1].find_all('span')
+            ).contents[1].find_all('span')
         return match
 
     def get_payload(self) -> list[dict[str, str | pdfplumber.pdf.PDF]]:
         match = self.get_contents()
 
         if self.url:
-            date: str = require_non_none(
-                match[0].parent.parent.contents[1].text.strip(),
-            )
+            date: str = match[0].parent.parent.contents[1].text.strip()
             title = match[0].text
-            url = require_non_none(self.url)
+            url = self.url
 
         else:
             date = match[0].text.strip()
             title = match[1].text.strip()
             url = (
-                f'https://www.supremecourt.gov/'
-                f"{match[1].contents[0]['href']}"
+                f"{_SCOTUS_ROOT}/{match[1].contents[0]['href']}"
             )
 
         retv = {
-            'date': datetime.strptime(date, '%m/%d/%y').strftime('%Y-%m-%d'),
+            'date': _mdy_to_ymd(date),
             'title': title,
             'url': url,
             'pdf': read_pdf(url),
         }
         return [retv]
 
-    def get_url_for_term(self) -> None:
-        """Get URL with Term Year suffix."""
-        if not self.url:
-            # Grabbing most recent date, so get today's Term.
-            self.base_url += get_term_year(datetime.today().date())
-        else:
-            self.base_url = suffix_base_url(
-                self.base_url, self.url,
-            )
-
 
 class OpinionsFetcherStrategy(FetcherStrategy):
+    __slots__ = ()
+
+    def get_strainer(self) -> bs4.SoupStrainer:
+        """Only the opinion tables are read from the opinions page."""
+        import bs4
+
+        return bs4.SoupStrainer('table', class_='table table-bordered')
 
     def get_disposition(self, docket_json: Any, date: str) -> str | None:
         if self.stream is Stream.SLIP_OPINIONS:
+            decision_date = _parse_mdy(date)
             disposition_text = [
                 entry['Text']
                 for entry in docket_json['ProceedingsandOrder']
-                if bool(
-                    re.search(
-                        r'AFFIRMED|DISMISSED|REMANDED|REVERSED|VACATED',
-                        entry['Text'],
-                    ),
-                ) and (
-                    datetime.strptime(
-                        entry['Date'], '%b %d %Y',
-                    ) == datetime.strptime(
-                        date,
-                        '%m/%d/%y',
-                    )
+                if bool(_DISPOSITION_RE.search(entry['Text'])) and (
+                    datetime.strptime(entry['Date'], '%b %d %Y')
+                    == decision_date
                 )
             ]
             if len(disposition_text) > 1:
@@ -205,26 +288,77 @@ class OpinionsFetcherStrategy(FetcherStrategy):
         return retv
 
     def get_contents(self) -> pd.DataFrame:
+        rows = []
+        if self.url:
+            # only the row linking to the opinion is needed
+            link = self.soup.find(
+                'a', href=self.url.removeprefix(_SCOTUS_ROOT),
+            )
+            if link is not None:
+                tr = link.find_parent('tr')
+                columns = self.get_columns(tr.find_parent('table'))
+                rows.append(self.get_row(tr, columns))
+            return self.make_table(rows)
 
         tbls = self.soup.find_all('table', class_='table table-bordered')
-        dfs = pd.read_html(str(tbls))
-        for i, df in enumerate(dfs):
-            links = [row.find_all('a') for row in tbls[i].find_all('tr')]
-            # get last link in row (i.e. the Revised opinion if it exists)
-            hrefs = [
-                f'https://www.supremecourt.gov{link[-1].get("href")}'
-                for link in links if len(link) > 0
-            ]
-            df['url'] = hrefs
-            # get holding from first link (NOT revised opinion)
-            if self.stream is Stream.SLIP_OPINIONS:
-                # Opinions relating to orders do not have holdings
-                holdings = [
-                    link[0].get('title') for link in links if len(link) > 0
-                ]
-                df['holding'] = holdings
+        for tbl in tbls:
+            columns = self.get_columns(tbl)
+            for tr in tbl.find_all('tr'):
+                row = self.get_row(tr, columns)
+                if row is not None:
+                    rows.append(row)
+
+        return self.make_table(rows)
+
+    def make_table(self, rows: list[dict[str, str | None]]) -> pd.DataFrame:
+        """Return DataFrame of table rows.
+
+        With no rows, the columns get_payload reads are still present so
+        that filtering an empty table selects nothing instead of raising.
+        """
+        import pandas as pd
+
+        if rows:
+            return pd.DataFrame(rows)
+        columns = ['Date', 'Docket', 'Name', 'J.', 'url']
+        if self.stream is Stream.SLIP_OPINIONS:
+            columns.append('holding')
+        return pd.DataFrame(columns=columns)
 
-        return pd.concat(dfs).reset_index()
+    @staticmethod
+    def get_columns(tbl: bs4.Tag) -> list[str]:
+        """Return the column names of an opinions table.
+
+        Some term tables put their header in plain <td> cells, in which
+        case the first row is used.
+        """
+        header = tbl('th')
+        if not header:
+            first_row = tbl.find('tr')
+            header = first_row('td') if first_row is not None else []
+        return [remove_extra_whitespace(c.get_text()) for c in header]
+
+    def get_row(
+        self, tr: bs4.Tag, columns: list[str],
+    ) -> dict[str, str | None] | None:
+        """Return the cells of a table row keyed by column, plus its links.
+
+        Values are stripped of surrounding whitespace here, so callers can
+        use them as is. Return None for the header row.
+        """
+        cells = tr.find_all('td')
+        links = tr.find_all('a')
+        if not cells or not links:
+            return None
+        texts = (remove_extra_whitespace(c.get_text()) for c in cells)
+        row: dict[str, str | None] = dict(zip(columns, texts))
+        # get last link in row (i.e. the Revised opinion if it exists)
+        row['url'] = f'{_SCOTUS_ROOT}{links[-1].get("href").strip()}'
+        # get holding from first link (NOT revised opinion)
+        if self.stream is Stream.SLIP_OPINIONS:
+            # Opinions relating to orders do not have holdings
+            row['holding'] = links[0].get('title', '').strip()
+        return row
 
     def get_payload(self) -> list[dict[str, str | pdfplumber.pdf.PDF]]:
         retv = []
@@ -238,82 +372,106 @@ class OpinionsFetcherStrategy(FetcherStrategy):
             selected_rows = table[table['Date'] == self.date]
         else:
             selected_rows = table.head(1)
-        for _, row in selected_rows.iterrows():
-            date = row['Date'].strip()
-            docket_number = row['Docket'].strip()
-            author_initials = row['J.'].strip()
-            title = row['Name'].strip()
-            if 'holding' in table.columns:
-                holding = row['holding'].strip()
-            else:
-                holding = None
-            url = row['url'].strip()
-
-            try:
-                docket_json = self.get_docket_json(
-                    create_docket_number(
-                        re.sub(
-                            r'\s\(.+\)',
-                            '',
-                            docket_number,
-                        ),
+
+        # Download each row's PDF and docket JSON concurrently. Rows sharing
+        # a docket (e.g. several opinions in one case) share its JSON.
+        docket_jsons: dict[str, Future[dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+            downloads = []
+            for row in selected_rows.to_dict('records'):
+                docket_number = self.get_docket_number(row)
+                if docket_number not in docket_jsons:
+                    docket_jsons[docket_number] = executor.submit(
+                        self.get_docket_json, docket_number,
+                    )
+                downloads.append(
+                    (
+                        row,
+                        executor.submit(read_pdf, row['url']),
+                        docket_jsons[docket_number],
                     ),
                 )
-                petitioner = docket_json['PetitionerTitle']
-                if 'RespondentTitle' in docket_json:  # mandamus has no respdt.
-                    respondent = docket_json['RespondentTitle']
-                else:
-                    respondent = None
-                lower_court = docket_json['LowerCourt']
-                case_number = docket_json['CaseNumber']
-                disposition_text = self.get_disposition(docket_json, date)
-            except JSONDecodeError:
-                value = 'No JSON case data. Case too old.'
-                petitioner = value
-                respondent = value
-                lower_court = value
-                case_number = value
-                disposition_text = value
-            finally:
-                d = {
-                    'date': (
-                        datetime.strptime(date, '%m/%d/%y').strftime(
-                            '%Y-%m-%d',
-                        )
+            for row, pdf, docket_json in downloads:
+                retv.append(
+                    self.get_row_payload(
+                        row, pdf.result(), docket_json, table,
                     ),
-                    'title': title,
-                    'petitioner': petitioner,
-                    'respondent': respondent,
-                    'lower_court': lower_court,
-                    'case_number': remove_extra_whitespace(case_number),
-                    'holding': holding,
-                    'disposition_text': disposition_text,
-                    'is_per_curiam': author_initials == 'PC',
-                    'is_decree': author_initials == 'D',
-                    'url': url,
-                    'pdf': read_pdf(url),
-                }
-                retv.append(d)
+                )
         return retv
 
+    @staticmethod
+    def get_docket_number(row: dict[str, Any]) -> str:
+        """Return the docket number used to fetch a row's case JSON."""
+        return create_docket_number(
+            _DOCKET_PAREN_RE.sub('', row['Docket']),
+        )
+
+    def get_row_payload(
+        self, row: dict[str, Any], pdf: pdfplumber.pdf.PDF,
+        docket_json_future: Future[dict[str, Any]], table: pd.DataFrame,
+    ) -> dict[str, str | pdfplumber.pdf.PDF]:
+        """Return payload dict for a single row of the opinions table."""
+        date = row['Date']
+        author_initials = row['J.']
+        title = row['Name']
+        if 'holding' in table.columns:
+            holding = row['holding']
+        else:
+            holding = None
+        url = row['url']
+
+        try:
+            docket_json = docket_json_future.result()
+            petitioner = docket_json['PetitionerTitle']
+            if 'RespondentTitle' in docket_json:  # mandamus has no respdt.
+                respondent = docket_json['RespondentTitle']
+            else:
+                respondent = None
+            lower_court = docket_json['LowerCourt']
+            case_number = docket_json['CaseNumber']
+            disposition_text = self.get_disposition(docket_json, date)
+        except JSONDecodeError:
+            value = 'No JSON case data. Case too old.'
+            petitioner = value
+            respondent = value
+            lower_court = value
+            case_number = value
+            disposition_text = value
+
+        return {
+            'date': _mdy_to_ymd(date),
+            'title': title,
+            'petitioner': petitioner,
+            'respondent': respondent,
+            'lower_court': lower_court,
+            'case_number': remove_extra_whitespace(case_number),
+            'holding': holding,
+            'disposition_text': disposition_text,
+            'is_per_curiam': author_initials == 'PC',
+            'is_decree': author_initials == 'D',
+            'url': url,
+            'pdf': pdf,
+        }
+
     @staticmethod
     def get_docket_json(docket_number: str) -> dict[str, Any]:
         """Return case JSON from SCOTUS online docket."""
         url = (
-            f'https://www.supremecourt.gov/rss/cases/json/{docket_number}.json'
+            f'{_SCOTUS_ROOT}/rss/cases/json/{docket_number}.json'
         )
-        return json.loads(requests.get(url).text)
+        return json_loads(SESSION.get(url, timeout=REQUEST_TIMEOUT).content)
 
 
 class Fetcher:
+    __slots__ = (
+        'stream', 'strategy', 'url', 'term_year', 'date', 'most_recent',
+    )
     stream: Stream
     strategy: type[FetcherStrategy]
-    payload: str
     url: str | None
     term_year: str | None
     date: str | None
     most_recent: bool
-    nlp: Language
 
     def __init__(
         self, stream: Stream, date: str | None = None,
@@ -331,6 +489,22 @@ class Fetcher:
     def from_url(cls, url: str, stream: Stream) -> Fetcher:
         return cls(stream=stream, url=url)
 
+    @classmethod
+    def fetch_all(
+        cls, streams: list[Stream], date: str | None = None,
+        term_year: str | None = None,
+    ) -> list[list[dict[str, Stream | str | pdfplumber.pdf.PDF]]]:
+        """Get the payloads of several streams, fetching them concurrently.
+
+        Return one payload list per stream, in the order given.
+        """
+        fetchers = [
+            cls(stream=stream, date=date, term_year=term_year)
+            for stream in streams
+        ]
+        with ThreadPoolExecutor(max_workers=len(fetchers) or 1) as executor:
+            return list(executor.map(cls.get_payload, fetchers))
+
     def get_payload(
         self,
     ) -> list[dict[str, Stream | str | pdfplumber.pdf.PDF]]:
@@ -347,21 +521,13 @@ class Fetcher:
         return retv
 
     def set_strategy(self) -> None:
-        if self.stream is Stream.ORDERS:
-            self.strategy = OrdersFetcherStrategy
-        elif self.stream in (
-            Stream.SLIP_OPINIONS,
-            Stream.OPINIONS_RELATING_TO_ORDERS,
-        ):
-            self.strategy = OpinionsFetcherStrategy
-        else:
+        if self.stream not in _STRATEGIES:
             raise NotImplementedError
+        self.strategy = _STRATEGIES[self.stream]
+
 
-#     def detect_changes(self) -> str:
-#         """TODO: Implement"""
-#         # to check for changes to order section
-#         div_orders = self.soup.find_all('div', class_='column2')[
-#             0
-#         ]  # there is one for "More" orders
-#         hash = hashlib.sha256(div_orders.text.encode('utf-8')).hexdigest()
-#         return hash
+_STRATEGIES: dict[Stream, type[FetcherStrategy]] = {
+    Stream.ORDERS: OrdersFetcherStrategy,
+    Stream.SLIP_OPINIONS: OpinionsFetcherStrategy,
+    Stream.OPINIONS_RELATING_TO_ORDERS: OpinionsFetcherStrategy,
+}
@@ -1,21 +1,107 @@
 from __future__ import annotations
 
+import atexit
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from datetime import datetime
 from datetime import timedelta
+from functools import lru_cache
 from io import BytesIO
-from typing import Any
+from itertools import repeat
+from multiprocessing import get_context
+from typing import TYPE_CHECKING
 from typing import TypeVar
 
-import pdfplumber
 import requests
+from urllib3.util import Retry
 
-from omg_scotus._enums import Disposition
+from omg_scotus._cache import read_cached_pdf
+from omg_scotus._cache import write_cached_pdf
 from omg_scotus.justice import JusticeTag
 
+if TYPE_CHECKING:
+    # pdfminer is slow to import, so pdfplumber is imported on first use
+    import bs4
+    import pdfplumber
+
 T = TypeVar('T')
 
+REQUEST_TIMEOUT = 30
+PDF_CHUNK_SIZE = 64 * 1024
+# spaCy pipes neither the release parsers nor authorship read from.
+NLP_DISABLED_PIPES = ['ner', 'lemmatizer']
+# Below this many pages, starting worker processes costs more than it saves.
+PARALLEL_EXTRACTION_MIN_PAGES = 8
+MAX_EXTRACTION_WORKERS = min(os.cpu_count() or 1, 4)
+
+# Shared by every request to supremecourt.gov so that TCP/TLS connections
+# are kept alive and reused instead of renegotiated on each call.
+SESSION = requests.Session()
+SESSION.headers['User-Agent'] = (
+    'Mozilla/5.0 (Windows NT 6.1; WOW64; rv:50.0)'
+    'Gecko/20100101 Firefox/50.0'
+)
+SESSION.mount(
+    'https://', requests.adapters.HTTPAdapter(
+        pool_connections=4, pool_maxsize=16,
+        # retry GETs on connection errors and transient gateway errors; if
+        # those persist, return the last response instead of raising so
+        # callers see the same failure as without retries
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        ),
+    ),
+)
+
+# Worker processes for text extraction, started on first use and reused by
+# every document. They are spawned rather than forked because callers may
+# already be running other threads.
+_EXTRACTION_POOL: ProcessPoolExecutor | None = None
+_EXTRACTION_POOL_LOCK = threading.Lock()
+
+# Whitespace after an opening or before a closing bracket, in one pass.
+_PAREN_INNER_SPACE_RE = re.compile(r'([\[\(\{])\s+|\s+([\]\)\}])')
+
+# A wrap-around hyphen (and the line break after it) or a soft hyphen.
+_HYPHENATION_RE = re.compile(r'-[^\S\n]*\n\s*|\xad\s*')
+_NOTICE_RE = re.compile(r'(?s)NOTICE:.+')
+_PARENTHESIZED_RE = re.compile(r'(?ms)\(.*?\)')
+# original-jurisdiction docket, e.g. '141, Orig.'
+_ORIG_DOCKET_RE = re.compile(r'(\d+)(?=.+Orig\.)')
+_JUSTICE_TITLES_RE = re.compile(
+    r'\,\s*J\s*[\.\,]+|\,\s*J\s*J\s*[\.\,]+|\,\s*C\s*\.\s*J\s*\.\,*|'
+    r'JUSTICE\s+|THE\s+(?=CHIEF)|CHIEF\s+JUSTICE|\,*\s*J\s*\.\,*',
+)
+_CHIEF_JUSTICE_RE = re.compile(r'(THE)*\s*CHIEF\s*JUSTICE\s*')
+_PER_CURIAM_RE = re.compile(
+    r'\bPER\s+CURIAM|DECREE|decree|ORDER\s+AND\s+JUDGMENT',
+)
+# matches any 4 or more capital letters together within word boundary.
+# Part-III was matching because it's three caps. Lol.
+_JUSTICE_NAME_RE = re.compile(r'\b(?!III)[A-Z]{4,}\b')
+# one named group per Disposition member; a bare DISMISSED is not reported
+_DISPOSITION_TYPE_RE = re.compile(
+    r'(?P<AFFIRMED>AFFIRMED(?!\s+IN\s+PART))|'
+    r'(?P<AFFIRMED_IN_PART>AFFIRMED\s+IN\s+PART)|'
+    r'DISMISSED(?!\s+IN\s+PART|\s+as\s+improvidently\s+granted)|'
+    r'(?P<DISMISSED>DISMISSED\s+IN\s+PART)|'
+    r'(?P<DISMISSED_AS_IMPROVIDENTLY_GRANTED>'
+    r'DISMISSED\s+as\s+improvidently\s+granted)|'
+    r'(?P<DISMISSED_FOR_WANT_OF_JURISDICTION>'
+    r'DISMISSED\s+for\s+want\s+of\s+jurisdiction)|'
+    r'(?P<REMANDED>REMANDED(?!\s+IN\s+PART))|'
+    r'(?P<REMANDED_IN_PART>REMANDED\s+IN\s+PART)|'
+    r'(?P<REVERSED>REVERSED(?!\s+IN\s+PART))|'
+    r'(?P<REVERSED_IN_PART>REVERSED\s+IN\s+PART)|'
+    r'(?P<VACATED>VACATED(?!\s+IN\s+PART))|'
+    r'(?P<VACATED_IN_PART>VACATED\s+IN\s+PART)|'
+    r'(?P<GRANTED>applications*\s+for\s+stays*[^.!?]+granted\.)',
+)
+
 
 def require_non_none(x: T | None) -> T:
     if x is None:
@@ -24,6 +110,17 @@ def require_non_none(x: T | None) -> T:
         return x
 
 
+@lru_cache(maxsize=64)
+def get_first_monday_in_october(year: int) -> date:
+    """Return date of first Monday in October."""
+    d = datetime(year, 10, 1)
+    offset = -d.weekday()
+    if offset < 0:
+        offset += 7
+    return (d + timedelta(offset)).date()
+
+
+@lru_cache(maxsize=1024)
 def get_term_year(dt: date) -> str:
     """Return Term Year given a date in XX format.
 
@@ -32,14 +129,6 @@ def get_term_year(dt: date) -> str:
     following year.
 
     """
-    def get_first_monday_in_october(year: int) -> date:
-        """Return date of first Monday in October."""
-        d = datetime(year, 10, 1)
-        offset = -d.weekday()
-        if offset < 0:
-            offset += 7
-        return (d + timedelta(offset)).date()
-
     t0 = get_first_monday_in_october(dt.year-1)
     t1 = get_first_monday_in_october(dt.year)
 
@@ -49,43 +138,161 @@ def get_term_year(dt: date) -> str:
         return str(dt.year)[2:]
 
 
-def suffix_base_url(base_url: str, url: str | None) -> str:
-    """Append year to base URL."""
-    # URL was passed, so get Term from extracted URL date
-    mmddyy = require_non_none(url).split('/')[-1][:6]
-    term_yr = get_term_year(datetime.strptime(mmddyy, '%m%d%y').date())
-    return base_url + term_yr
+def download_pdf(url: str) -> BytesIO:
+    """Return a buffer holding the PDF at url, positioned at its start.
+
+    PDFs are served from the on-disk cache when possible. Otherwise the
+    response is streamed in chunks into the returned buffer, which is also
+    what gets cached, so the body is never copied.
+    """
+    url = require_non_none(url)
+    data = read_cached_pdf(url)
+    if data is not None:
+        return BytesIO(data)
+    buffer = BytesIO()
+    with SESSION.get(
+        url, stream=True, timeout=REQUEST_TIMEOUT,
+        # PDF streams are compressed already; gzip would only cost CPU
+        headers={'Accept-Encoding': 'identity'},
+    ) as rq:
+        for chunk in rq.iter_content(chunk_size=PDF_CHUNK_SIZE):
+            buffer.write(chunk)
+    # don't cache error pages served in place of the PDF
+    with buffer.getbuffer() as view:
+        if rq.ok and view[:5] == b'%PDF-':
+            write_cached_pdf(url, view)
+    buffer.seek(0)
+    return buffer
 
 
 def read_pdf(url: str) -> pdfplumber.PDF:
     """Return pages object from url."""
-    rq = requests.get(require_non_none(url))
-    with pdfplumber.open(BytesIO(rq.content)) as pdf:
+    import pdfplumber
+
+    with pdfplumber.open(download_pdf(url)) as pdf:
         return pdf
 
 
-def get_pdf_text(
-    pdf: pdfplumber.pdf.PDF, from_pg: int | None = None,
-    to_pg: int | None = None,
-) -> str:
-    """Return pdf text in PDF document pages."""
-    return ''.join([p.extract_text() for p in pdf.pages[from_pg:to_pg]])
+def make_soup(
+    markup: bytes, parse_only: bs4.SoupStrainer | None = None,
+) -> bs4.BeautifulSoup:
+    """Parse HTML with lxml, falling back to the stdlib parser.
+
+    lxml is given the raw bytes so it can detect the encoding itself. If
+    parse_only is given, only the matching elements are built.
+    """
+    import bs4
+
+    try:
+        return bs4.BeautifulSoup(markup, 'lxml', parse_only=parse_only)
+    except bs4.FeatureNotFound:  # lxml is not installed
+        return bs4.BeautifulSoup(
+            markup, 'html.parser', parse_only=parse_only,
+        )
+
+
+def get_conditional_headers(response: requests.Response) -> dict[str, str]:
+    """Return headers that revalidate response's URL on the next GET.
+
+    A server that still has the same version of the page answers such a
+    request with an empty 304 Not Modified.
+    """
+    headers = {}
+    if 'ETag' in response.headers:
+        headers['If-None-Match'] = response.headers['ETag']
+    if 'Last-Modified' in response.headers:
+        headers['If-Modified-Since'] = response.headers['Last-Modified']
+    return headers
+
+
+def get_pdf_bytes(pdf: pdfplumber.pdf.PDF) -> bytes:
+    """Return the raw bytes backing an open PDF document."""
+    stream = pdf.stream
+    if isinstance(stream, BytesIO):
+        return stream.getvalue()
+    position = stream.tell()
+    stream.seek(0)
+    data = stream.read()
+    stream.seek(position)
+    return data
+
+
+def _extract_page_text(page: pdfplumber.page.Page) -> str:
+    """Return the text of page and drop its cached layout objects.
+
+    pdfplumber keeps every parsed char/line of a page alive once it has
+    been read, so flushing after extraction keeps memory bounded by a
+    single page rather than the whole document.
+    """
+    text = page.extract_text()
+    page.flush_cache()
+    return text
+
+
+def _extract_page_texts(data: bytes, start: int, stop: int) -> list[str]:
+    """Return the text of pages [start, stop) of the PDF in data."""
+    import pdfplumber
+
+    with pdfplumber.open(BytesIO(data)) as pdf:
+        return [_extract_page_text(p) for p in pdf.pages[start:stop]]
+
+
+def _get_extraction_pool() -> ProcessPoolExecutor:
+    """Return the shared text extraction pool, starting it if needed."""
+    global _EXTRACTION_POOL
+    with _EXTRACTION_POOL_LOCK:
+        if _EXTRACTION_POOL is None:
+            _EXTRACTION_POOL = ProcessPoolExecutor(
+                max_workers=MAX_EXTRACTION_WORKERS,
+                mp_context=get_context('spawn'),
+            )
+            atexit.register(_EXTRACTION_POOL.shutdown)
+        return _EXTRACTION_POOL
 
 
-def is_stay_order(order_title: str, pdf: pdfplumber.pdf.PDF) -> bool:
+def get_pdf_page_texts(pdf: pdfplumber.pdf.PDF) -> list[str]:
+    """Return the text of each page in PDF document.
+
+    Text extraction is by far the most expensive pdfplumber call, so it
+    should be done once per document and the result passed around. Longer
+    documents are split into page ranges extracted in worker processes.
+    """
+    n_pages = len(pdf.pages)
+    n_workers = min(MAX_EXTRACTION_WORKERS, n_pages)
+    if n_pages < PARALLEL_EXTRACTION_MIN_PAGES or n_workers < 2:
+        return [_extract_page_text(p) for p in pdf.pages]
+
+    data = get_pdf_bytes(pdf)
+    bounds = [n_pages * i // n_workers for i in range(n_workers + 1)]
+    chunks = _get_extraction_pool().map(
+        _extract_page_texts, repeat(data), bounds, bounds[1:],
+    )
+    return [text for chunk in chunks for text in chunk]
+
+
+def is_stay_order(order_title: str, pdf_page_texts: list[str]) -> bool:
     """Distinguish between Stay Order vs. Single Order List order.
 
     SCOTUS publishes Stay orders under the 'Miscellaneous Order' title,
     but the format is different from an Order List Misc. Order.
     """
 
-    cond1 = order_title.upper() == 'MISCELLANEOUS ORDER'
-    cond2 = len(pdf.pages) == 1
-    cond3 = ' '.join(
-        get_pdf_text(pdf).splitlines()[0]
-        .split(),
-    ) == 'Supreme Court of the United States'
-    return cond1 and cond2 and cond3
+    # cheapest checks first; only the first line of a one-page order is read
+    if order_title.upper() != 'MISCELLANEOUS ORDER':
+        return False
+    if len(pdf_page_texts) != 1:
+        return False
+    first_line = pdf_page_texts[0].partition('\n')[0]
+    return (
+        remove_extra_whitespace(first_line)
+        == 'Supreme Court of the United States'
+    )
+
+
+def is_page_number(line: str) -> bool:
+    """Return True if line is a bare page number footer, e.g. ' 12 '."""
+    line = line.strip()
+    return 0 < len(line) <= 4 and line.isdigit()
 
 
 def remove_extra_whitespace(s: str) -> str:
@@ -95,44 +302,45 @@ def remove_extra_whitespace(s: str) -> str:
 
 def remove_hyphenation(text: str) -> str:
     """Remove wrap-around hyphenation"""
-    retv = re.sub(
-        pattern=r'(\w+)-$\n(\w+)', repl=r'\1\2',
-        string=text, flags=re.M,
-    )
-    retv = re.sub(pattern=r'-\s*\n\s*(\n)*', repl='', string=retv, flags=re.M)
-    return re.sub(
-        pattern=r'\xad\s*',
-        repl='',
-        string=retv,
-    )
+    return _HYPHENATION_RE.sub('', text)
+
 
+def split_at_headers(
+    text: str, header: re.Pattern[str], last_header: re.Pattern[str],
+) -> list[str]:
+    """Split text into documents that each begin with a header.
 
-def remove_char_from_list(lst: list[Any], char: str) -> list[Any]:
-    return list(filter((char).__ne__, lst))
+    Each document runs up to the next header. The last one runs through
+    EOF and is only kept if its header also matches last_header.
+    """
+    starts = [m.start() for m in header.finditer(text)]
+    if not starts:
+        return []
+    retv = [text[start:end] for start, end in zip(starts, starts[1:])]
+    if last_header.match(text, starts[-1]):
+        retv.append(text[starts[-1]:])
+    return retv
 
 
 def remove_notice(text: str) -> str:
     """Remove NOTICE disclaimer from Syllabus text."""
-    return re.sub(r'(?s)NOTICE:.+', '', text)
+    return _NOTICE_RE.sub('', text)
 
 
 def remove_between_parentheses(text: str) -> str:
     """Remove all text between parentheses."""
-    return re.sub(r'(?ms)\(.*?\)', '', text)
+    return _PARENTHESIZED_RE.sub('', text)
 
 
 def remove_trailing_spaces_within_parentheses(text: str) -> str:
     """Remove unnecessary whitespace within parentheses."""
-    # opening parens
-    retv = re.sub(pattern=r'(?m)([\[\(\{])\s+', repl=r'\1', string=text)
-    # closing parens
-    retv = re.sub(pattern=r'(?m)\s+([\]\)\}])', repl=r'\1', string=retv)
-    return retv
+    # only one of the groups participates in a match; the other expands to ''
+    return _PAREN_INNER_SPACE_RE.sub(r'\1\2', text)
 
 
 def create_docket_number(string: str) -> str:
     """Return a docket number to fetch JSON from."""
-    match = re.match(r'(\d+)(?=.+Orig\.)', string)
+    match = _ORIG_DOCKET_RE.match(string)
     if match:
         return f'22O{match.groups()[0]}'
     else:
@@ -141,12 +349,7 @@ def create_docket_number(string: str) -> str:
 
 def remove_justice_titles(string: str) -> str:
     """Removes JUSTICE, J., J. J., C . J ."""
-    pattern = (
-        r'\,\s*J\s*[\.\,]+|\,\s*J\s*J\s*[\.\,]+|\,\s*C\s*\.\s*J\s*\.\,*|'
-        r'JUSTICE\s+|THE\s+(?=CHIEF)|CHIEF\s+JUSTICE|\,*\s*J\s*\.\,*'
-    )
-    s = re.sub(pattern, '', string)
-    return s
+    return _JUSTICE_TITLES_RE.sub('', string)
 
 
 def add_padding_to_periods(string: str) -> str:
@@ -156,10 +359,7 @@ def add_padding_to_periods(string: str) -> str:
 
 def chief_justice_to_last_name(string: str) -> str:
     """Replace CHIEF JUSTICE with the current Chief Justice's name."""
-    pattern = (
-        r'(THE)*\s*CHIEF\s*JUSTICE\s*'
-    )
-    return re.sub(pattern, 'ROBERTS', string)
+    return _CHIEF_JUSTICE_RE.sub('ROBERTS', string)
 
 
 def get_justices_from_sent(
@@ -170,41 +370,19 @@ def get_justices_from_sent(
     sent = remove_justice_titles(sent)
     sent = remove_extra_whitespace(sent)
     sent = chief_justice_to_last_name(sent)
-    if bool(
-        re.search(
-            r'\bPER\s+CURIAM|DECREE|decree|ORDER\s+AND\s+JUDGMENT',
-            sent,
-        ),
-    ):
+    if _PER_CURIAM_RE.search(sent):
         return [JusticeTag.PER_CURIAM]
-    # matches any 3 or more capital letters together within word boundary.
-    # Part-III was matching because it's three caps. Lol.
-    pattern = r'\b(?!III)[A-Z]{4,}\b'
     return [
         JusticeTag.from_string(remove_extra_whitespace(m))
-        for m in re.findall(
-            pattern,
-            sent,
-        )
+        for m in _JUSTICE_NAME_RE.findall(sent)
     ]
 
 
 def get_disposition_type(string: str) -> list[str]:
     """Return Disposition from holding text."""
 
-    retv = []
-    d = {i: disposition for i, disposition in enumerate(Disposition)}
-    p = (
-        r'(AFFIRMED(?!\s+IN\s+PART))|(AFFIRMED\s+IN\s+PART)|DISMISSED(?!\s'
-        r'+IN\s+PART|\s+as\s+improvidently\s+granted)|(DISMISSED\s+IN\s+'
-        r'PART)|(DISMISSED\s+as\s+improvidently\s+granted)|(DISMISSED\s+'
-        r'for\s+want\s+of\s+jurisdiction)|(REMANDED(?!\s+IN\s+PART))|(REM'
-        r'ANDED\s+IN\s+PART)|(REVERSED(?!\s+IN\s+PART))|(REVERSED\s+IN\s+P'
-        r'ART)|(VACATED(?!\s+IN\s+PART))|(VACATED\s+IN\s+PART)|(applications'
-        r'*\s+for\s+stays*[^.!?]+granted\.)'
-    )
-    for m in re.finditer(p, string):
-        for i, _ in enumerate(m.groups()):
-            if _:
-                retv.append(d[i].name)
-    return retv
+    # each match sets at most one group, named after its Disposition
+    return [
+        m.lastgroup for m in _DISPOSITION_TYPE_RE.finditer(string)
+        if m.lastgroup is not None
+    ]
@@ -5,6 +5,7 @@ from collections.abc import Iterable
 from datetime import date
 from enum import auto
 from enum import Enum
+from functools import lru_cache
 
 from dateutil.relativedelta import relativedelta
 
@@ -49,42 +50,45 @@ class JusticeTag(Enum):
     @staticmethod
     def from_string(s: str) -> JusticeTag:
         """Return JusticeTag from string."""
-        d = {
-            'CHIEF JUSTICE': JusticeTag.ROBERTS,
-            'JUSTICE THOMAS': JusticeTag.THOMAS,
-            'JUSTICE BREYER': JusticeTag.BREYER,
-            'JUSTICE ALITO': JusticeTag.ALITO,
-            'JUSTICE SOTOMAYOR': JusticeTag.SOTOMAYOR,
-            'JUSTICE KAGAN': JusticeTag.KAGAN,
-            'JUSTICE GORSUCH': JusticeTag.GORSUCH,
-            'JUSTICE KAVANAUGH': JusticeTag.KAVANAUGH,
-            'JUSTICE BARRETT': JusticeTag.BARRETT,
-            'JUSTICE JACKSON': JusticeTag.JACKSON,
-            'JUSTICE GINSBURG': JusticeTag.GINSBURG,
-            'JUSTICE KENNEDY': JusticeTag.KENNEDY,
-            'JUSTICE SCALIA': JusticeTag.SCALIA,
-            'JUSTICE SOUTER': JusticeTag.SOUTER,
-            'PER CURIAM': JusticeTag.PER_CURIAM,
-            'ROBERTS': JusticeTag.ROBERTS,
-            'THOMAS': JusticeTag.THOMAS,
-            'BREYER': JusticeTag.BREYER,
-            'ALITO': JusticeTag.ALITO,
-            'SOTOMAYOR': JusticeTag.SOTOMAYOR,
-            'KAGAN': JusticeTag.KAGAN,
-            'GORSUCH': JusticeTag.GORSUCH,
-            'KAVANAUGH': JusticeTag.KAVANAUGH,
-            'BARRETT': JusticeTag.BARRETT,
-            'GINSBURG': JusticeTag.GINSBURG,
-            'KENNEDY': JusticeTag.KENNEDY,
-            'SCALIA': JusticeTag.SCALIA,
-            'SOUTER': JusticeTag.SOUTER,
-        }
-        if s not in d:
+        if s not in _JUSTICE_TAGS:
             raise NotImplementedError(
                 f'String {s} not recognized as a Justice.',
             )
         else:
-            return d[s]
+            return _JUSTICE_TAGS[s]
+
+
+# built once rather than on every from_string call
+_JUSTICE_TAGS: dict[str, JusticeTag] = {
+    'CHIEF JUSTICE': JusticeTag.ROBERTS,
+    'JUSTICE THOMAS': JusticeTag.THOMAS,
+    'JUSTICE BREYER': JusticeTag.BREYER,
+    'JUSTICE ALITO': JusticeTag.ALITO,
+    'JUSTICE SOTOMAYOR': JusticeTag.SOTOMAYOR,
+    'JUSTICE KAGAN': JusticeTag.KAGAN,
+    'JUSTICE GORSUCH': JusticeTag.GORSUCH,
+    'JUSTICE KAVANAUGH': JusticeTag.KAVANAUGH,
+    'JUSTICE BARRETT': JusticeTag.BARRETT,
+    'JUSTICE JACKSON': JusticeTag.JACKSON,
+    'JUSTICE GINSBURG': JusticeTag.GINSBURG,
+    'JUSTICE KENNEDY': JusticeTag.KENNEDY,
+    'JUSTICE SCALIA': JusticeTag.SCALIA,
+    'JUSTICE SOUTER': JusticeTag.SOUTER,
+    'PER CURIAM': JusticeTag.PER_CURIAM,
+    'ROBERTS': JusticeTag.ROBERTS,
+    'THOMAS': JusticeTag.THOMAS,
+    'BREYER': JusticeTag.BREYER,
+    'ALITO': JusticeTag.ALITO,
+    'SOTOMAYOR': JusticeTag.SOTOMAYOR,
+    'KAGAN': JusticeTag.KAGAN,
+    'GORSUCH': JusticeTag.GORSUCH,
+    'KAVANAUGH': JusticeTag.KAVANAUGH,
+    'BARRETT': JusticeTag.BARRETT,
+    'GINSBURG': JusticeTag.GINSBURG,
+    'KENNEDY': JusticeTag.KENNEDY,
+    'SCALIA': JusticeTag.SCALIA,
+    'SOUTER': JusticeTag.SOUTER,
+}
 
 
 class Justice:
@@ -169,13 +173,20 @@ class Justice:
             )
 
 
+@lru_cache(maxsize=None)
+def _get_justice_patterns() -> tuple[tuple[re.Pattern[str], JusticeTag], ...]:
+    """Return compiled Justice name patterns, built once per process."""
+    return tuple(
+        (re.compile(j._get_regex_pattern(), re.DOTALL | re.M | re.I), j.tag)
+        for j in create_court(current=False)
+    )
+
+
 def extract_justice(string: str) -> JusticeTag:
     """Search text for Justices names and return first tag."""
-    court = create_court(current=False)
-    d = {j._get_regex_pattern(): j.tag for j in court}
-    for k, v in d.items():
-        if bool(re.search(k, string, re.DOTALL | re.M | re.I)):
-            return v
+    for pattern, tag in _get_justice_patterns():
+        if bool(pattern.search(string)):
+            return tag
     raise NotImplementedError
 
 
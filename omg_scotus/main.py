@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import Sequence
 
@@ -9,24 +10,28 @@ from spacy.language import Language
 
 from omg_scotus.fetcher import Fetcher
 from omg_scotus.fetcher import Stream
+from omg_scotus.helpers import NLP_DISABLED_PIPES
 from omg_scotus.parser import Parser
 from omg_scotus.tweet import TwitterPublisher
 
 
-def get_doc(id: str, stream: Stream, nlp: Language) -> Any:
+def get_doc_url(id: str, stream: Stream) -> str:
     if stream is Stream.ORDERS:
-        url = (
+        return (
             f'https://www.supremecourt.gov/'
             f'orders/courtorders/{id}.pdf'
         )
     elif stream in (Stream.SLIP_OPINIONS, Stream.OPINIONS_RELATING_TO_ORDERS):
-        url = (
+        return (
             f'https://www.supremecourt.gov/'
             f'opinions/{id}.pdf'
         )
     else:
         raise NotImplementedError
-    fr = Fetcher.from_url(url, stream)
+
+
+def get_doc(id: str, stream: Stream, nlp: Language) -> Any:
+    fr = Fetcher.from_url(get_doc_url(id, stream), stream)
     pr = Parser(msg=fr.get_payload()[0], nlp=nlp)
     return pr.get_object()
 
@@ -45,20 +50,14 @@ def get_stream(args: Any) -> Stream:
 def add_custom_rules_to_nlp(nlp: Language) -> None:
     # Add custom rules to nlp
     ruler = nlp.get_pipe('attribute_ruler')
-    patterns = [
-        [{'TEXT': 'SCALIA'}],
-        [{'TEXT': 'ALITO'}],
-        [{'TEXT': 'THOMAS'}],
-    ]
+    # one set-membership pattern instead of one pattern per justice
+    patterns = [[{'TEXT': {'IN': ['SCALIA', 'ALITO', 'THOMAS']}}]]
     attrs = {'DEP': 'nsubj'}
     ruler.add(patterns=patterns, attrs=attrs)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
 
-    nlp = spacy.load('en_core_web_sm')
-    add_custom_rules_to_nlp(nlp)
-
     parser = argparse.ArgumentParser(description='Run omg-scotus!')
 
     group = parser.add_mutually_exclusive_group()
@@ -89,16 +88,22 @@ def main(argv: Sequence[str] | None = None) -> int:
     else:
         raise NotImplementedError
 
-    # Fetch and parse releases
-    if option:
-        if option == 'nourl':
-            docs = []
-            payloads = Fetcher(get_stream(args), date=None).get_payload()
-            for payload in payloads:
-                doc = Parser(payload, nlp).get_object()
-                docs.append(doc)
-        else:
-            docs = [get_doc(option, get_stream(args), nlp)]
+    stream = get_stream(args)
+    if option == 'nourl':
+        fetcher = Fetcher(stream, date=None)
+    else:
+        fetcher = Fetcher.from_url(get_doc_url(option, stream), stream)
+
+    # Download releases while the spaCy model loads, then parse them
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending_payloads = executor.submit(fetcher.get_payload)
+        # the release parsers need sentences and tags, not NER or lemmas
+        nlp = spacy.load('en_core_web_sm', disable=NLP_DISABLED_PIPES)
+        add_custom_rules_to_nlp(nlp)
+        payloads = pending_payloads.result()
+    if option != 'nourl':
+        payloads = payloads[:1]
+    docs = [Parser(payload, nlp).get_object() for payload in payloads]
 
     tp = TwitterPublisher()
 
@@ -5,12 +5,14 @@ from abc import ABC
 from abc import abstractmethod
 from collections import defaultdict
 from typing import Any
+from typing import cast
 
 from spacy.language import Language
 
 from omg_scotus._enums import DocumentType
 from omg_scotus.fetcher import Stream
-from omg_scotus.helpers import get_pdf_text
+from omg_scotus.helpers import get_pdf_page_texts
+from omg_scotus.helpers import is_page_number
 from omg_scotus.helpers import is_stay_order
 from omg_scotus.helpers import require_non_none
 from omg_scotus.opinion import StayOpinion
@@ -19,6 +21,12 @@ from omg_scotus.release import OrderRelease
 from omg_scotus.release import Release
 from omg_scotus.release import SlipOpinion
 
+# Rules orders repeat the rules title and page number on every page.
+_RULES_HEADER_FOOTER_RE = re.compile(
+    r'(?m)^\s+FEDERAL\s+RULES\s+OF\s+[A-Z]+\s+PROCEDURE\s+\d+\s+|\s+'
+    r'\d+\s+FEDERAL\s+RULES\s+OF\s+[A-Z]+\s+PROCEDURE\s+$',
+)
+
 
 class ParserStrategy(ABC):
 
@@ -40,18 +48,21 @@ class ParserStrategy(ABC):
 
 class OpinionParserStrategy(ParserStrategy):
     def parse(self) -> str:
-        retv = ''
-        for start, end in self.msg['pdf_page_indices']:
-            segment = self.msg['pdf_text'][start:end]
-            lines = segment.splitlines()
+        pages = []
+        for segment in self.msg['pdf_page_texts']:
+            if not segment:
+                continue
             # if the first line is a space, it is a decree with short header
-            if len(lines) > 0:
-                header_end_idx = 2 if lines[0].isspace() else 3
-                # omit header
-                retv += '\n' + '\n'.join(lines[header_end_idx:])
-        if retv == '':
+            first_line = segment.partition('\n')[0]
+            header_end_idx = 2 if first_line.isspace() else 3
+            # omit header, splitting off only the header lines
+            lines = segment.split('\n', header_end_idx)
+            pages.append(
+                lines[header_end_idx] if len(lines) > header_end_idx else '',
+            )
+        if not pages:
             raise ValueError('No opinion text was parsed.')
-        return retv
+        return '\n' + '\n'.join(pages)
 
     def get_object(self) -> Release:
         parsed_text = self.parse()
@@ -119,24 +130,25 @@ class OrderListParserStrategy(ParserStrategy):
 
         is_misc_order = self.msg['title'] == 'Miscellaneous Order'
         is_order_list = self.msg['title'] == 'Order List'
+        order_pages = []
 
-        for start, end in self.msg['pdf_page_indices']:
-            segment = self.msg['pdf_text'][start:end]
+        for segment in self.msg['pdf_page_texts']:
+            # split off the last line only, instead of every line of the page
+            body, _, last_line = segment.rpartition('\n')
             # Miscellaneous Orders aren't numbered, but OrderLists are
             if (
                 is_misc_order or
                 (
                     is_order_list
-                    and segment.splitlines()[-1].strip().isnumeric()
+                    and is_page_number(last_line)
                 )
             ):
                 # ends w/ page num, so it's an order page
                 if is_order_list:
-                    segment = '\n'.join(segment.splitlines()[:-1])  # crop Pg#
-                if 'orders_text' in retv:
-                    retv['orders_text'] += segment
-                else:
-                    retv['orders_text'] = segment
+                    segment = body  # crop Pg#
+                order_pages.append(segment)
+        if order_pages:
+            retv['orders_text'] = ''.join(order_pages)
         return retv
 
     def get_object(self) -> list[Release]:
@@ -163,11 +175,8 @@ class StayOrderParserStrategy(ParserStrategy):
 
     def parse(self) -> str:
         """Return Stay Order text."""
-        retv = ''
-        for start, end in self.msg['pdf_page_indices']:
-            segment = self.msg['pdf_text'][start:end]
-            retv += segment
-        return retv
+        # every page is kept, so this is the whole document text
+        return cast(str, self.msg['pdf_text'])
 
     def get_object(self) -> list[Any]:
         parsed_order = self.parse()
@@ -177,12 +186,9 @@ class StayOrderParserStrategy(ParserStrategy):
 class RulesParserStrategy(ParserStrategy):
 
     def parse(self) -> str:
-        retv = get_pdf_text(self.msg['pdf'], 3)
-        retv = re.sub(
-            r'(?m)^\s+FEDERAL\s+RULES\s+OF\s+[A-Z]+\s+PROCEDURE\s+\d+\s+|\s+'
-            r'\d+\s+FEDERAL\s+RULES\s+OF\s+[A-Z]+\s+PROCEDURE\s+$', '', retv,
-
-        )  # eliminate footer and header
+        retv = ''.join(self.msg['pdf_page_texts'][3:])
+        # eliminate footer and header
+        retv = _RULES_HEADER_FOOTER_RE.sub('', retv)
         return retv
 
     def get_object(self) -> Release:
@@ -213,22 +219,11 @@ class Parser:
     ) -> None:
         self.msg = msg
         self.nlp = nlp
+        self.msg['pdf_page_texts'] = get_pdf_page_texts(self.msg['pdf'])
         self.document_type = self.set_document_type()
-        self.msg['pdf_text'] = get_pdf_text(self.msg['pdf'])
-        self.msg['pdf_page_indices'] = self.get_pdf_page_indices()
+        self.msg['pdf_text'] = ''.join(self.msg['pdf_page_texts'])
         self.set_parser_strategy()
 
-    def get_pdf_page_indices(self) -> list[tuple[int, int]]:
-        """Return start and end indices for each page in PDF."""
-        retv, start, pdf_text = [], 0, self.msg['pdf_text']
-        for p in self.msg['pdf'].pages:
-            pg_len = len(p.extract_text())
-            end = start + pg_len
-            assert pdf_text[start:end] == p.extract_text()
-            retv.append((start, end))
-            start += pg_len
-        return retv
-
     def set_document_type(self) -> DocumentType:
         """Set document type for parsing strategy to consume."""
         if self.msg['stream'] is Stream.ORDERS:
@@ -237,7 +232,7 @@ class Parser:
             elif self.msg['title'] == 'Miscellaneous Order':
                 if is_stay_order(
                     order_title=self.msg['title'],
-                    pdf=self.msg['pdf'],
+                    pdf_page_texts=self.msg['pdf_page_texts'],
                 ):
                     return DocumentType.STAY_ORDER
                 else:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Iterator
 
 import pdfplumber
 import spacy
@@ -22,6 +23,7 @@ from omg_scotus.helpers import remove_justice_titles
 from omg_scotus.helpers import remove_notice
 from omg_scotus.helpers import remove_trailing_spaces_within_parentheses
 from omg_scotus.helpers import require_non_none
+from omg_scotus.helpers import split_at_headers
 from omg_scotus.justice import create_court
 from omg_scotus.justice import JusticeTag
 from omg_scotus.opinion import OpinionType
@@ -29,6 +31,52 @@ from omg_scotus.order import Rule
 from omg_scotus.section import OrderSection
 from omg_scotus.section import Section
 
+_ORTO_HEADER_RE = re.compile(r'SUPREME COURT OF THE UNITED STATES')
+_ORTO_LAST_HEADER_RE = re.compile(r'SUPREME COURT OF THE UNITED STATES ')
+_RECUSALS_RE = re.compile(r'(?s)(?<=\.)[^.!?]+\s+took\s+no\s+part\s.+$')
+_SYLLABUS_ATTRIBUTION_RE = re.compile(r'(?ms)\b[A-Z]{4,}\,\s(C\. |J)*J\..*')
+_SYLLABUS_AUTHORSHIP_RE = re.compile(
+    r'(?s).*?(?=\.[^.!?]+filed|unanimous|case|Parts*'
+    r'|judgment|except|all\s+but)',
+)
+# matches first sentence after "YYYY]", disregards J. title
+_OPINION_ATTRIBUTION_RE = re.compile(
+    r'(?ms)(?<=[^\[]\d{4}\])[^.!?\]\[]+(?:J\.)*[^.!?\]\[]+\.',
+)
+_PER_CURIAM_RE = re.compile(r'PER\s+CURIAM|DECREE|ORDER\s+AND\s+JUDGMENT')
+_ORTO_ATTRIBUTION_RE = re.compile(
+    r'(?ms)(?<=\d{4})[^.!?\]\[]+\.([^.!?\]\[]+\.)',
+)
+_SLIP_OPINION_ATTRIBUTION_RE = re.compile(r'(?ms)(?<=\d{4})[^.!?\]\[\d]+\.')
+# checked in order, first match wins
+_OPINION_TYPE_PATTERNS = (
+    (re.compile(r'Statement\s+of\s+'), OpinionType.STATEMENT),
+    (re.compile(r'(?:dissent)\w+\b'), OpinionType.DISSENT),
+    (re.compile(r'(?:concurr)\w+\b'), OpinionType.CONCURRENCE),
+    (re.compile(r'delivered\s+an\s+opinion'), OpinionType.PLURALITY),
+    (re.compile(r'delivered\s+the\s+opinion'), OpinionType.MAJORITY),
+    (re.compile(r'PER CURIAM'), OpinionType.PER_CURIAM),
+    (re.compile(r'(?i)DECREE|ORDER\s+AND\s+JUDGMENT'), OpinionType.DECREE),
+    (re.compile(r'stay'), OpinionType.STAY),
+)
+_ORDER_TITLE_RE = re.compile(r'\S.*\n')
+# shared prefixes/suffixes are factored out so a near-miss fails after
+# one branch instead of being retried against every alternative
+_ORDER_SECTION_HEADER_RE = re.compile(
+    r'CERTIORARI +(?:-- +SUMMARY +DISPOSITIONS*|GRANTED|DENIED)'
+    r'|ORDERS* +IN +PENDING +CASES*'
+    r'|(?:HABEAS +CORPUS|MANDAMUS|REHEARINGS*) +DENIED',
+)
+_RULE_TITLE_RE = re.compile(r'Rule\s+([\d\.]+\.)(.+?)(?=Rule|$)')
+_RULE_TITLE_ASTERISK_RE = re.compile(r'\s\*')
+_RULE_CONTENT_RE = re.compile(r'(?ms)^Rule\s+[\d\.]+\.(.+?)(?=^Rule|\Z)')
+_SLIP_OPINION_HEADER_RE = re.compile(
+    r'SUPREME\s+COURT\s+OF\s+THE\s+UNITED\s+STATES',
+)
+_SLIP_OPINION_LAST_HEADER_RE = re.compile(
+    r'SUPREME\s+COURT\s+OF\s+THE\s+UNITED\s+STATES\s',
+)
+
 
 class Release(ABC):
     """There are 3 types of releases by the Court:
@@ -103,8 +151,7 @@ class OpinionDocument(Document, ABC):
         pass
 
     def set_recusals(self) -> None:
-        pattern = r'(?s)(?<=\.)[^.!?]+\s+took\s+no\s+part\s.+$'
-        recusals_sent = re.search(pattern, self._attribution_sentence)
+        recusals_sent = _RECUSALS_RE.search(self._attribution_sentence)
         if recusals_sent:
             self.recusals = get_justices_from_sent(recusals_sent.group())
 
@@ -130,7 +177,9 @@ class OpinionDocument(Document, ABC):
 
 class Syllabus(OpinionDocument):
     """Syllabus for a Slip Opinion."""
-    alignment_tuple: list[tuple[OpinionType, str, list[str]]]
+    alignment_tuple: list[
+        tuple[OpinionType, JusticeTag | None, list[JusticeTag] | None]
+    ]
 
     def __init__(
         self, text: str, nlp: Language,
@@ -138,7 +187,7 @@ class Syllabus(OpinionDocument):
     ) -> None:
         super().__init__(text=text, nlp=nlp, document_type=document_type)
         self._attribution_sentence = self.get_attribution_sentence()
-        self.get_alignment_tuple()
+        self.alignment_tuple = self.get_alignment_tuple()
         self.recusals = None
         self.set_recusals()
         self.assign_authorship()
@@ -151,8 +200,6 @@ class Syllabus(OpinionDocument):
 
         e.g. 'KAGAN, J. delivered the opinion of... in which ... joined.'
         """
-        # pattern = r'(?ms)^\s*[A-Z]{4,}\,\s+[CJ\s\.\,]+.+'
-        pattern = r'(?ms)\b[A-Z]{4,}\,\s(C\. |J)*J\..*'
         string = remove_extra_whitespace(
             remove_notice(
                 remove_hyphenation(
@@ -161,12 +208,8 @@ class Syllabus(OpinionDocument):
             ),
         )
         retv = require_non_none(
-            re.search(
-                pattern,
-                string,
-            ),
+            _SYLLABUS_ATTRIBUTION_RE.search(string),
         ).group()
-        retv = remove_hyphenation(retv)
         retv = remove_justice_titles(retv)
         retv = add_padding_to_periods(retv)
         return retv
@@ -264,12 +307,8 @@ class Syllabus(OpinionDocument):
     def assign_authorship(self) -> None:
         """Parse first sentence of attribution sentence and set authorship."""
         # first sentence before the word 'filed'
-        pattern = (
-            r'(?s).*?(?=\.[^.!?]+filed|unanimous|case|Parts*'
-            r'|judgment|except|all\s+but)'
-        )
         sent = require_non_none(
-            re.search(pattern, self._attribution_sentence),
+            _SYLLABUS_AUTHORSHIP_RE.search(self._attribution_sentence),
         ).group()
         self.set_authorship(sent)
 
@@ -297,41 +336,22 @@ class Opinion(OpinionDocument):
 
     def get_attribution_sentence(self) -> str:
         """Return sentence used to determine authorship and opinion type."""
-        # matches first sentence after "YYYY]", disregards J. title
-        retv: str = ''
-        pattern = (
-            r'(?ms)(?<=[^\[]\d{4}\])[^.!?\]\[]+(?:J\.)*[^.!?\]\[]+\.'
-        )
-
         # PER CURIAMS do not have square brackets -- oops, they can in body
-        try:
-            retv = re.findall(pattern, self.text)[0]
-        except IndexError:
-            try:
-                retv = re.findall(
-                    r'PER\s+CURIAM|DECREE|ORDER\s+AND\s+JUDGMENT', self.text,
-                )[0]
-            except IndexError:
-                try:
-                    # get first sentence after brackets
-                    if (
-                        self.document_type
-                        is DocumentType.OPINION_RELATING_TO_ORDERS
-                    ):
-                        pattern = (
-                            r'(?ms)(?<=\d{4})[^.!?\]\[]+\.'
-                            r'([^.!?\]\[]+\.)'
-                        )
-                        retv = re.findall(pattern, self.text)[0]
-                    elif self.document_type is DocumentType.SLIP_OPINION:
-                        pattern = r'(?ms)(?<=\d{4})[^.!?\]\[\d]+\.'
-                        retv = re.findall(pattern, self.text)[0]
-                    else:
-                        raise NotImplementedError
-                except IndexError:
-                    raise
-        finally:
-            return retv
+        match = (
+            _OPINION_ATTRIBUTION_RE.search(self.text)
+            or _PER_CURIAM_RE.search(self.text)
+        )
+        if match is not None:
+            return match.group()
+        # get first sentence after brackets
+        if self.document_type is DocumentType.OPINION_RELATING_TO_ORDERS:
+            match = _ORTO_ATTRIBUTION_RE.search(self.text)
+            return match.group(1) if match is not None else ''
+        elif self.document_type is DocumentType.SLIP_OPINION:
+            match = _SLIP_OPINION_ATTRIBUTION_RE.search(self.text)
+            return match.group() if match is not None else ''
+        else:
+            return ''
 
     def assign_authorship(self) -> None:
         sent = remove_hyphenation(self._attribution_sentence)
@@ -349,7 +369,7 @@ class Opinion(OpinionDocument):
             if self.joiners:
                 retv += (
                     f'\nJoined by:  '
-                    f'{", ".join([s.name for s in self.joiners])}'
+                    f'{", ".join(s.name for s in self.joiners)}'
                 )
         return retv
 
@@ -357,30 +377,10 @@ class Opinion(OpinionDocument):
     def get_type(text: str) -> OpinionType:
         """Return opinion type."""
 
-        STATEMENT_PATTERN = r'Statement\s+of\s+'
-        DISSENT_PATTERN = r'(?:dissent)\w+\b'
-        CONCURRENCE_PATTERN = r'(?:concurr)\w+\b'
-        PLURALITY_PATTERN = r'delivered\s+an\s+opinion'
-        MAJORITY_PATTERN = r'delivered\s+the\s+opinion'
-        PER_CURIAM_PATTERN = r'PER CURIAM'
-        DECREE_PATTERN = r'(?i)DECREE|ORDER\s+AND\s+JUDGMENT'
-        STAY_PATTERN = r'stay'
-
-        d = {
-            STATEMENT_PATTERN: OpinionType.STATEMENT,
-            DISSENT_PATTERN: OpinionType.DISSENT,
-            CONCURRENCE_PATTERN: OpinionType.CONCURRENCE,
-            PLURALITY_PATTERN: OpinionType.PLURALITY,
-            MAJORITY_PATTERN: OpinionType.MAJORITY,
-            PER_CURIAM_PATTERN: OpinionType.PER_CURIAM,
-            DECREE_PATTERN: OpinionType.DECREE,
-            STAY_PATTERN: OpinionType.STAY,
-        }
-
         text = remove_hyphenation(text)  # remove artifacts
-        for k, v in d.items():
-            if bool(re.search(k, text)):
-                return v
+        for pattern, opinion_type in _OPINION_TYPE_PATTERNS:
+            if bool(pattern.search(text)):
+                return opinion_type
         raise NotImplementedError
 
     def compose_tweet(self) -> str:
@@ -403,31 +403,18 @@ class OrderList(Document):
 
     def get_title(self) -> str:
         """Return Order Title (first non space character through EOL."""
-        pattern = r'\S.*\n'
-        match = require_non_none(re.search(pattern, self.text))
+        match = require_non_none(_ORDER_TITLE_RE.search(self.text))
         return remove_extra_whitespace(match.group())
 
     def set_sections(self) -> None:
         """Create and append OrderSections for OrderList."""
-        # regex pattern looks text between section headers and between
-        # last section header and EOF
-        pattern = (
-            r'(CERTIORARI +-- +SUMMARY +DISPOSITIONS*|ORDERS* +IN +PENDING '
-            r'+CASES*|CERTIORARI +GRANTED|CERTIORARI +DENIED|HABEAS +CORPUS '
-            r'+DENIED|MANDAMUS +DENIED|REHEARINGS* +DENIED)(.*?(?=CERTIORARI +'
-            r'-- +SUMMARY +DISPOSITIONS*|ORDERS* +IN +PENDING +CASES*|CERTIORA'
-            r'RI +GRANTED|CERTIORARI +DENIED|HABEAS +CORPUS +DENIED|MANDAMUS +'
-            r'DENIED|REHEARINGS* +DENIED)|.*$)'
-        )
-        matches = re.finditer(
-            pattern=pattern,
-            string=self.text, flags=re.DOTALL,
-        )
+        # a section runs from its header to the next header, or to EOF
+        headers = list(_ORDER_SECTION_HEADER_RE.finditer(self.text))
+        ends = [h.start() for h in headers[1:]] + [len(self.text)]
 
-        for m in matches:
-            section_title, section_content = remove_extra_whitespace(
-                m.groups()[0],
-            ), m.groups()[1]
+        for header, end in zip(headers, ends):
+            section_title = remove_extra_whitespace(header.group())
+            section_content = self.text[header.end():end]
 
             section = OrderSection(
                 label=section_title,
@@ -451,7 +438,7 @@ class OrderList(Document):
 
     def __str__(self) -> str:
         """Return string representation of OrderList."""
-        return '\n'.join([str(s) for s in self.sections])
+        return '\n'.join(str(s) for s in self.sections)
 
 
 class RuleOrder(Document):
@@ -487,42 +474,40 @@ class RuleOrder(Document):
 
     def get_bolded_text(self) -> str:
         """Get bolded text to find Rule # and Titles."""
-        return ''.join(
-            [
-                c['text'] for p in self.pdf.pages[3:]
-                for c in p.chars
-                if c['fontname'] == 'TimesNewRomanPS-BoldMT'
-            ],
-        )
+        return ''.join(self._iter_bolded_chars())
+
+    def _iter_bolded_chars(self) -> Iterator[str]:
+        """Yield bolded chars one page at a time, flushing each page."""
+        for p in self.pdf.pages[3:]:
+            for c in p.chars:
+                if c['fontname'] == 'TimesNewRomanPS-BoldMT':
+                    yield c['text']
+            p.flush_cache()
 
     def get_rules(self) -> None:
         """Create Rule from rule, title in bolded text."""
         # find text between ^Rule
-        pattern = r'Rule\s+([\d\.]+\.)(.+?)(?=Rule|$)'
-        for m in re.finditer(pattern, self.get_bolded_text()):
+        for m in _RULE_TITLE_RE.finditer(self.get_bolded_text()):
             number, title = m.groups()
             title = remove_extra_whitespace(title)
-            title = re.sub(r'\s\*', '', title)  # elim asterisks
+            title = _RULE_TITLE_ASTERISK_RE.sub('', title)  # elim asterisks
             rule = Rule(number=number, title=title)
             self.rules.append(rule)
         self.set_rule_content()
 
     def set_rule_content(self) -> None:
         """Set text of rule."""
-        pattern = r'(?ms)^Rule\s+[\d\.]+\.(.+?)(?=^Rule|\Z)'
-        for i, m in enumerate(re.finditer(pattern, self.text)):
+        for i, m in enumerate(_RULE_CONTENT_RE.finditer(self.text)):
             self.rules[i].contents = m.group()
 
     def __str__(self) -> str:
-        retv = '\n'
-        retv += f'{"~"*72}\n'
-        retv += (
-            f'{self.title.upper()}:  {len(self.rules)} rules '
-            f'affected\n'
+        rules = ''.join(str(r) for r in self.rules)
+        return (
+            f'\n{"~"*72}\n'
+            f'{self.title.upper()}:  {len(self.rules)} rules affected\n'
+            f'{"~"*72}\n'
+            f'{rules}'
         )
-        retv += f'{"~"*72}\n'
-        retv += ''.join([str(r) for r in self.rules])
-        return retv
 
     def compose_tweet(self) -> str:
         s = (
@@ -605,7 +590,7 @@ class SlipOpinion(Release):
         self,
     ) -> tuple[list[JusticeTag], list[JusticeTag | None], str, list[str]]:
         if self.syllabus:
-            majority_opinion, *opinions = self.syllabus.get_alignment_tuple()
+            majority_opinion, *opinions = self.syllabus.alignment_tuple
         elif self.is_decree:
             majority_opinion, opinions = [
                 (
@@ -688,17 +673,10 @@ class SlipOpinion(Release):
 
     def set_documents(self) -> None:
         """Get Opinions"""
-        pattern = (
-            r'(?ms)(SUPREME\s+COURT\s+OF\s+THE\s+UNITED\s+STATES.*?'
-            r'(?=SUPREME\s+COURT\s+OF\s+THE\s+UNITED\s+STATES))|(SUPREME\s+'
-            r'COURT\s+OF\s+THE\s+UNITED\s+STATES\s+.*)'
+        # each document runs from one SCOTUS header to the next, or to EOF.
+        doc_texts = split_at_headers(
+            self.text, _SLIP_OPINION_HEADER_RE, _SLIP_OPINION_LAST_HEADER_RE,
         )
-        # pattern searches for text betwen SCOTUS headers, as well as EOF.
-        # joining because last match thru EOF is captured in group 2.
-        doc_texts = [
-            ''.join(f) for f in
-            re.findall(pattern=pattern, string=self.text)
-        ]
 
         if not (self.is_per_curiam or self.is_decree):
             self.syllabus = Syllabus(
@@ -792,16 +770,10 @@ class OpinionRelatingToOrder(Release):
         return ' v. '.join([self.petitioner, self.respondent])
 
     def set_documents(self) -> None:
-        pattern = (
-            r'(?ms)(SUPREME COURT OF THE UNITED STATES.*?(?=SUPREME COURT OF '
-            r'THE UNITED STATES))|(SUPREME COURT OF THE UNITED STATES .*)'
+        # documents run between SCOTUS headers, the last one through EOF.
+        doc_texts = split_at_headers(
+            self.text, _ORTO_HEADER_RE, _ORTO_LAST_HEADER_RE,
         )
-        # this pattern searches for text betwen SCOTUS headers, as well as EOF.
-        # joining because last match thru EOF is captured in group 2.
-        doc_texts = [
-            ''.join(f) for f in
-            re.findall(pattern=pattern, string=self.text)
-        ]
         for doc_text in doc_texts:
             self.documents.append(
                 Opinion(
@@ -824,11 +796,13 @@ class OpinionRelatingToOrder(Release):
 
     def __str__(self) -> str:
         """Return string representation of OrderList."""
-        s = f'\n{self.case_number}\n{self.date}\n\n'
-        s += f"{'OPINION RELATING TO ORDER SUMMARY':~^{72}}"
-        s += f'\nLink  {self.url}'
-        s += '\n'.join([str(o) for o in self.documents])  # print orders
-        return s
+        documents = '\n'.join(str(o) for o in self.documents)
+        return (
+            f'\n{self.case_number}\n{self.date}\n\n'
+            f"{'OPINION RELATING TO ORDER SUMMARY':~^{72}}"
+            f'\nLink  {self.url}'
+            f'{documents}'  # print orders
+        )
 
     def compose_tweet(self) -> str:
         try:
@@ -887,10 +861,11 @@ class OrderRelease(Release):
 
     def __str__(self) -> str:
         """Return string representation of OrderList."""
-        s = f'\n{self.title}\n{self.date}\n\n'
-        s += f"{'ORDER SUMMARY':~^{72}}"
-        s += f'{self.document}'
-        return s
+        return (
+            f'\n{self.title}\n{self.date}\n\n'
+            f"{'ORDER SUMMARY':~^{72}}"
+            f'{self.document}'
+        )
 
     def compose_tweet(self) -> str:
         """Return tweetable summary."""
@@ -7,7 +7,10 @@ from enum import Enum
 
 from omg_scotus.case import Case
 from omg_scotus.helpers import remove_extra_whitespace
-# from omg_scotus._enums import OrderSectionType
+
+_CASE_RE = re.compile(
+    r'(\d+.*?\d|\d+.*?ORIG\.)\s+(.*?V.*?$|IN\s+RE.*?$)', flags=re.M,
+)
 
 
 class Section(ABC):
@@ -36,15 +39,12 @@ class OrderSection(Section):
 
     def set_cases(self) -> None:
         """Get all cases in Section."""
-        pattern = r'(\d+.*?\d|\d+.*?ORIG\.)\s+(.*?V.*?$|IN\s+RE.*?$)'
-        matches = re.findall(pattern=pattern, string=self.text, flags=re.M)
-
         self.cases = [
             Case(
-                number=m[0],
-                name=remove_extra_whitespace(m[1]),
+                number=m.group(1),
+                name=remove_extra_whitespace(m.group(2)),
             )
-            for m in matches
+            for m in _CASE_RE.finditer(self.text)
         ]
 
     def get_cases_text(self) -> tuple[int, list[str]]:
@@ -53,10 +53,7 @@ class OrderSection(Section):
         num_cases = 0
         if len(self.cases) > 0:
             num_cases = len(self.cases)
-            cases_text = [
-                '  '.join([c.number, c.name]).strip()
-                for c in self.cases
-            ]
+            cases_text = [f'{c.number}  {c.name}' for c in self.cases]
 
         return num_cases, cases_text
 
@@ -1,6 +1,8 @@
+from __future__ import annotations
+
+import asyncio
 import datetime
-import hashlib
-import time
+import zlib
 from typing import Tuple
 
 import beepy
@@ -8,7 +10,11 @@ import bs4
 import requests
 
 from omg_scotus.fetcher import Stream
+from omg_scotus.helpers import get_conditional_headers
 from omg_scotus.helpers import get_term_year
+from omg_scotus.helpers import make_soup
+from omg_scotus.helpers import REQUEST_TIMEOUT
+from omg_scotus.helpers import SESSION
 from omg_scotus.main import main
 
 
@@ -18,9 +24,11 @@ class ChangeDetector:
     watch_element: bs4.BeautifulSoup
     scrape_interval: int
     main_args: Tuple[str]
+    response: requests.Response | None
 
     def __init__(self, stream: Stream, scrape_interval: int = 30):
         self.stream = stream
+        self.response = None
         self.main_args = self.set_main_args()
         self.url = self.set_url()
         self.response = self.get_response()
@@ -55,52 +63,80 @@ class ChangeDetector:
             raise NotImplementedError
 
     def get_response(self) -> requests.Response:
-        """Get HTML response."""
-        return requests.get(self.url)
+        """Get HTML response, revalidating against the last one if any."""
+        headers = (
+            get_conditional_headers(self.response)
+            if self.response is not None else {}
+        )
+        return SESSION.get(self.url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+    def get_strainer(self) -> bs4.SoupStrainer:
+        """Return filter for the part of the page holding the watch element.
+
+        The page is re-parsed on every change, so nothing else is built.
+        """
+        if self.stream is Stream.ORDERS:
+            return bs4.SoupStrainer('div', class_='column2')
+        elif self.stream in (
+            Stream.SLIP_OPINIONS,
+            Stream.OPINIONS_RELATING_TO_ORDERS,
+        ):
+            return bs4.SoupStrainer('tr')
+        else:
+            raise NotImplementedError
 
     def set_watch_element(self) -> bs4.BeautifulSoup:
         """Set element to monitor for changes."""
-        soup = bs4.BeautifulSoup(self.response.text, 'html.parser')
+        soup = make_soup(self.response.content, parse_only=self.get_strainer())
         if self.stream is Stream.ORDERS:
-            return soup.find_all('div', class_='column2')[0]
+            return soup.find('div', class_='column2')
         elif self.stream in (
             Stream.SLIP_OPINIONS,
             Stream.OPINIONS_RELATING_TO_ORDERS,
         ):
-            return soup.find_all('tr')[2]
+            # stop after the third row instead of collecting every row
+            return soup.find_all('tr', limit=3)[2]
         else:
             raise NotImplementedError
 
-    def refresh(self) -> None:
-        """Refresh the page."""
-        self.response = self.get_response()
+    def refresh(self) -> bool:
+        """Refresh the page. Return False if the server reports no change."""
+        response = self.get_response()
+        if response.status_code == requests.codes.not_modified:
+            return False
+        self.response = response
         self.watch_element = self.set_watch_element()
+        return True
 
-    def get_hash(self) -> str:
-        """Get hash from watched element."""
-        return hashlib.sha256(
-            self.watch_element.text.encode('utf-8'),
-        ).hexdigest()
+    def get_hash(self) -> int:
+        """Get checksum of watched element; only used to detect changes."""
+        return zlib.crc32(self.watch_element.text.encode('utf-8'))
 
-    def start_detection(self) -> None:
+    async def start_detection(self) -> None:
         """Detect whether an element has had a change, and execute main
         function depending on the stream that changed.
+
+        Blocking work (requests, parsing, main) runs in a worker thread so
+        several detectors can poll concurrently from one event loop.
         """
         print(f'\nMonitoring {self.stream}...\n')
         hash = self.get_hash()
         print(hash)
         while True:
             try:
-                time.sleep(self.scrape_interval)
-                self.refresh()
+                await asyncio.sleep(self.scrape_interval)
+                # a 304 means the page, and so the hash, is unchanged
+                if not await asyncio.to_thread(self.refresh):
+                    print(f'Last checked: {datetime.datetime.now()}')
+                    continue
                 new_hash = self.get_hash()
                 print(new_hash)
                 print(f'Last checked: {datetime.datetime.now()}')
                 if hash == new_hash:
                     continue
                 else:
-                    beepy.beep(sound='ready')
-                    main(argv=self.main_args)
+                    await asyncio.to_thread(beepy.beep, sound='ready')
+                    await asyncio.to_thread(main, argv=self.main_args)
                     break
 
             except Exception:
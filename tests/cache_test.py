@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+import time
+
+import pytest
+
+from omg_scotus import _cache
+from omg_scotus import helpers
+from omg_scotus._cache import read_cached_pdf
+from omg_scotus._cache import write_cached_pdf
+
+URL = 'https://www.supremecourt.gov/opinions/21pdf/20-1199_hgdj.pdf'
+
+
+@pytest.fixture(autouse=True)
+def _cache_enabled(monkeypatch):
+    monkeypatch.setattr(_cache, 'CACHE_ENABLED', True)
+
+
+def test_cached_pdf_round_trip(monkeypatch, tmp_path):
+    monkeypatch.setattr(_cache, 'CACHE_DIR', tmp_path / 'cache')
+    assert read_cached_pdf(URL) is None
+
+    write_cached_pdf(URL, b'%PDF-1.4 body')
+    assert read_cached_pdf(URL) == b'%PDF-1.4 body'
+    assert read_cached_pdf(URL + 'x') is None
+    assert [p.suffix for p in (tmp_path / 'cache').iterdir()] == ['.pdf']
+
+
+def test_download_pdf_uses_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(_cache, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(helpers.SESSION, 'get', None)  # no network access
+    write_cached_pdf(URL, b'%PDF-1.4 body')
+    assert helpers.download_pdf(URL).getvalue() == b'%PDF-1.4 body'
+
+
+def test_cached_pdf_expires(monkeypatch, tmp_path):
+    monkeypatch.setattr(_cache, 'CACHE_DIR', tmp_path)
+    write_cached_pdf(URL, b'%PDF-1.4 body')
+    old = _cache.get_cache_path(URL).stat().st_mtime - _cache.CACHE_MAX_AGE
+    os.utime(_cache.get_cache_path(URL), (old - 1, old - 1))
+    assert read_cached_pdf(URL) is None
+    assert not _cache.get_cache_path(URL).exists()
+
+
+def test_cached_pdf_disabled(monkeypatch, tmp_path):
+    monkeypatch.setattr(_cache, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(_cache, 'CACHE_ENABLED', False)
+    write_cached_pdf(URL, b'%PDF-1.4 body')
+    assert read_cached_pdf(URL) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cached_pdfs_evicted_oldest_first(monkeypatch, tmp_path):
+    monkeypatch.setattr(_cache, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(_cache, 'CACHE_MAX_BYTES', 25)
+    for i in range(3):
+        write_cached_pdf(f'{URL}{i}', b'%PDF-1.4 body')  # 13 bytes each
+        mtime = time.time() - 10 + i
+        os.utime(_cache.get_cache_path(f'{URL}{i}'), (mtime, mtime))
+    _cache.evict_cached_pdfs()
+    assert [read_cached_pdf(f'{URL}{i}') is None for i in range(3)] == [
+        True, True, False,
+    ]
+
+
+def test_download_pdf_caches_streamed_body(monkeypatch, tmp_path):
+    class Response:
+        ok = True
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+
+        def iter_content(self, chunk_size):
+            return iter((b'%PDF-1.4 ', b'body'))
+
+    monkeypatch.setattr(_cache, 'CACHE_DIR', tmp_path)
+    monkeypatch.setattr(helpers.SESSION, 'get', lambda *a, **k: Response())
+    buffer = helpers.download_pdf(URL)
+    assert buffer.read() == b'%PDF-1.4 body'
+    assert read_cached_pdf(URL) == b'%PDF-1.4 body'
@@ -1 +1,201 @@
 from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from omg_scotus import fetcher
+from omg_scotus.fetcher import _get_term_year_from_url
+from omg_scotus.fetcher import _mdy_to_ymd
+from omg_scotus.fetcher import clear_soup_cache
+from omg_scotus.fetcher import Fetcher
+from omg_scotus.fetcher import OpinionsFetcherStrategy
+from omg_scotus.fetcher import OrdersFetcherStrategy
+from omg_scotus.fetcher import Stream
+from omg_scotus.helpers import make_soup
+
+
+def test_get_soup_reuses_recent_parse(monkeypatch):
+    downloads = []
+
+    def download_soup(self, validators):
+        downloads.append(validators)
+        return object(), {'If-None-Match': 'v1'}
+
+    clear_soup_cache()
+    monkeypatch.setattr(OrdersFetcherStrategy, 'download_soup', download_soup)
+    kwargs = {'stream': Stream.ORDERS, 'date': None, 'term_year': '22'}
+    first = OrdersFetcherStrategy(**kwargs)
+    second = OrdersFetcherStrategy(**kwargs)
+    assert first.soup is second.soup
+    assert len(downloads) == 1
+
+    monkeypatch.setattr(fetcher, 'SOUP_CACHE_TTL', 0)
+    OrdersFetcherStrategy(**kwargs)
+    assert downloads == [{}, {'If-None-Match': 'v1'}]
+
+
+def test_get_soup_keeps_parse_when_not_modified(monkeypatch):
+    responses = iter(((object(), {'If-None-Match': 'v1'}), (None, {})))
+
+    def download_soup(self, validators):
+        return next(responses)
+
+    clear_soup_cache()
+    monkeypatch.setattr(fetcher, 'SOUP_CACHE_TTL', 0)
+    monkeypatch.setattr(OrdersFetcherStrategy, 'download_soup', download_soup)
+    kwargs = {'stream': Stream.ORDERS, 'date': None, 'term_year': '22'}
+    first = OrdersFetcherStrategy(**kwargs)
+    second = OrdersFetcherStrategy(**kwargs)
+    assert second.soup is first.soup
+
+
+@pytest.mark.parametrize(
+    ('s', 'expected'),
+    (
+        ('6/30/22', '2022-06-30'),
+        ('12/01/09', '2009-12-01'),
+        ('01/9/15', '2015-01-09'),
+    ),
+)
+def test_mdy_to_ymd(s, expected):
+    assert _mdy_to_ymd(s) == expected
+
+
+@pytest.mark.parametrize(
+    ('url', 'expected'),
+    (
+        (
+            'https://www.supremecourt.gov/orders/courtorders/frbk22_3e04.pdf',
+            '21',
+        ),
+        (
+            'https://www.supremecourt.gov/opinions/21pdf/20-1199_hgdj.pdf',
+            '21',
+        ),
+        (
+            'https://www.supremecourt.gov/orders/courtorders/'
+            '100322zor_6537.pdf',
+            '22',
+        ),
+    ),
+)
+def test_get_term_year_from_url(url, expected):
+    assert _get_term_year_from_url(url) == expected
+
+
+@pytest.mark.parametrize(
+    'header',
+    (
+        b'<tr><th>Date</th><th>Docket</th><th>Name</th><th>Revised</th></tr>',
+        b'<tr><td>Date</td><td>Docket</td><td>Name</td><td>Revised</td></tr>',
+    ),
+)
+def test_opinions_get_contents(monkeypatch, header):
+    html = b'<table class="table table-bordered">' + header + b'''
+    <tr>
+      <td>6/30/22</td><td>20-1199</td>
+      <td><a href="/opinions/21pdf/20-1199_hgdj.pdf" title="Held: x">
+        Students for Fair
+        Admissions</a></td>
+      <td><a href="/opinions/21pdf/20-1199_rev.pdf">7/1/22</a></td>
+    </tr>
+    </table>'''
+
+    def download_soup(self, validators):
+        return make_soup(html, parse_only=self.get_strainer()), {}
+
+    clear_soup_cache()
+    monkeypatch.setattr(
+        OpinionsFetcherStrategy, 'download_soup', download_soup,
+    )
+    url = 'https://www.supremecourt.gov/opinions/21pdf/20-1199_rev.pdf'
+    expected = [
+        {
+            'Date': '6/30/22',
+            'Docket': '20-1199',
+            'Name': 'Students for Fair Admissions',
+            'Revised': '7/1/22',
+            'url': url,
+            'holding': 'Held: x',
+        },
+    ]
+    strategy = OpinionsFetcherStrategy(
+        stream=Stream.SLIP_OPINIONS, date=None, term_year='21',
+    )
+    assert strategy.get_contents().to_dict('records') == expected
+
+    strategy = OpinionsFetcherStrategy(
+        stream=Stream.SLIP_OPINIONS, date=None, url=url,
+    )
+    assert strategy.get_contents().to_dict('records') == expected
+
+
+@pytest.mark.parametrize(
+    'html',
+    (
+        b'<table class="table table-bordered"><tr><th>Date</th></tr></table>',
+        b'<p>No opinions yet this term.</p>',
+    ),
+)
+def test_opinions_get_payload_url_not_listed(monkeypatch, html):
+    def download_soup(self, validators):
+        return make_soup(html, parse_only=self.get_strainer()), {}
+
+    clear_soup_cache()
+    monkeypatch.setattr(
+        OpinionsFetcherStrategy, 'download_soup', download_soup,
+    )
+    strategy = OpinionsFetcherStrategy(
+        stream=Stream.SLIP_OPINIONS, date=None,
+        url='https://www.supremecourt.gov/opinions/21pdf/20-1199_hgdj.pdf',
+    )
+    assert strategy.get_contents().empty
+    assert strategy.get_payload() == []
+
+
+def test_fetch_all_keeps_stream_order(monkeypatch):
+    def get_payload(self):
+        return [{'stream': self.stream}]
+
+    monkeypatch.setattr(Fetcher, 'get_payload', get_payload)
+    streams = [Stream.ORDERS, Stream.SLIP_OPINIONS]
+    assert Fetcher.fetch_all(streams) == [
+        [{'stream': Stream.ORDERS}], [{'stream': Stream.SLIP_OPINIONS}],
+    ]
+
+
+def test_opinions_get_payload_fetches_each_docket_once(monkeypatch):
+    rows = [
+        {'Docket': '20-1199', 'url': 'a.pdf'},
+        {'Docket': '21-707', 'url': 'b.pdf'},
+        {'Docket': '20-1199', 'url': 'c.pdf'},
+    ]
+    dockets = []
+
+    def get_docket_json(self, docket_number):
+        dockets.append(docket_number)
+        return {'CaseNumber': docket_number}
+
+    def get_row_payload(self, row, pdf, docket_json_future, table):
+        return (pdf, docket_json_future.result())
+
+    monkeypatch.setattr(fetcher, 'read_pdf', str.upper)
+    monkeypatch.setattr(
+        OpinionsFetcherStrategy, 'get_contents',
+        lambda self: pd.DataFrame(rows),
+    )
+    monkeypatch.setattr(
+        OpinionsFetcherStrategy, 'get_docket_json', get_docket_json,
+    )
+    monkeypatch.setattr(
+        OpinionsFetcherStrategy, 'get_row_payload', get_row_payload,
+    )
+    strategy = OpinionsFetcherStrategy.__new__(OpinionsFetcherStrategy)
+    strategy.url = strategy.date = None
+    strategy.term_year = '21'
+    assert strategy.get_payload() == [
+        ('A.PDF', {'CaseNumber': '20-1199'}),
+        ('B.PDF', {'CaseNumber': '21-707'}),
+        ('C.PDF', {'CaseNumber': '20-1199'}),
+    ]
+    assert sorted(dockets) == ['20-1199', '21-707']
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from datetime import date
 
 import pytest
@@ -7,10 +8,16 @@ import pytest
 from omg_scotus._enums import Disposition
 from omg_scotus.helpers import create_docket_number
 from omg_scotus.helpers import get_disposition_type
+from omg_scotus.helpers import get_first_monday_in_october
 from omg_scotus.helpers import get_justices_from_sent
 from omg_scotus.helpers import get_term_year
+from omg_scotus.helpers import is_page_number
+from omg_scotus.helpers import make_soup
 from omg_scotus.helpers import remove_extra_whitespace
 from omg_scotus.helpers import remove_hyphenation
+from omg_scotus.helpers import remove_trailing_spaces_within_parentheses
+from omg_scotus.helpers import SESSION
+from omg_scotus.helpers import split_at_headers
 from omg_scotus.justice import JusticeTag
 
 
@@ -29,6 +36,18 @@ def test_get_term_year(dt, expected):
     assert get_term_year(dt) == expected
 
 
+@pytest.mark.parametrize(
+    ('year', 'expected'),
+    (
+        (2019, date(2019, 10, 7)),
+        (2022, date(2022, 10, 3)),
+        (2023, date(2023, 10, 2)),
+    ),
+)
+def test_get_first_monday_in_october(year, expected):
+    assert get_first_monday_in_october(year) == expected
+
+
 @pytest.mark.parametrize(
     ('s', 'expected'),
     (
@@ -41,6 +60,22 @@ def test_remove_extra_whitespace(s, expected):
     assert remove_extra_whitespace(s) == expected
 
 
+@pytest.mark.parametrize(
+    ('s', 'expected'),
+    (
+        ('3', True),
+        ('  12 ', True),
+        ('', False),
+        ('  ', False),
+        ('12a', False),
+        ('(ORDER LIST: 598 U.S.)', False),
+        ('12345', False),
+    ),
+)
+def test_is_page_number(s: str, expected: bool) -> None:
+    assert is_page_number(s) is expected
+
+
 def test_remove_hyphenation():
     text = """The State acknowledges that the Court of Criminal Ap-
 peals “never reached the federal issues Love raises,” Brief
@@ -63,6 +98,63 @@ Court’s jurisdiction.  See Foster v. Chatman, 578 U. S. 488,
     assert remove_hyphenation(text) == expected
 
 
+@pytest.mark.parametrize(
+    ('s', 'expected'),
+    (
+        ('juris-  \n\n  diction', 'jurisdiction'),
+        ('juris\xad  diction', 'jurisdiction'),
+        ('harmless-error', 'harmless-error'),
+        ('word -\n', 'word '),
+    ),
+)
+def test_remove_hyphenation_edge_cases(s: str, expected: str) -> None:
+    assert remove_hyphenation(s) == expected
+
+
+@pytest.mark.parametrize(
+    ('s', 'expected'),
+    (
+        ('no header', []),
+        ('HDR a HDR b', ['HDR a ', 'HDR b']),
+        ('x HDR a HDR\n', ['HDR a ']),
+        ('HDR HDR', ['HDR ']),
+    ),
+)
+def test_split_at_headers(s: str, expected: list[str]) -> None:
+    header, last_header = re.compile('HDR'), re.compile('HDR ')
+    assert split_at_headers(s, header, last_header) == expected
+
+
+@pytest.mark.parametrize(
+    ('s', 'expected'),
+    (
+        ('( a )', '(a)'),
+        ('[\n a b\n]', '[a b]'),
+        ('f(  )  {x }', 'f()  {x}'),
+        ('no parens', 'no parens'),
+    ),
+)
+def test_remove_trailing_spaces_within_parentheses(
+    s: str, expected: str,
+) -> None:
+    assert remove_trailing_spaces_within_parentheses(s) == expected
+
+
+def test_make_soup_falls_back_without_lxml(monkeypatch):
+    import bs4
+
+    real_init = bs4.BeautifulSoup.__init__
+
+    def init(self, markup, features=None, *args, **kwargs):
+        if features == 'lxml':
+            raise bs4.FeatureNotFound
+        real_init(self, markup, features, *args, **kwargs)
+
+    assert make_soup(b'<p>a</p>').p.text == 'a'
+    monkeypatch.setattr(bs4.BeautifulSoup, '__init__', init)
+    assert make_soup(b'<p>b</p>').p.text == 'b'
+
+
 @pytest.mark.parametrize(
     ('s', 'expected'),
     (
@@ -131,3 +223,9 @@ def test_get_justices_from_sent(s: str, expected: str) -> None:
 )
 def test_get_disposition_type(s, expected):
     assert get_disposition_type(s) == expected
+
+
+def test_session_returns_response_after_status_retries():
+    retry = SESSION.get_adapter('https://www.supremecourt.gov').max_retries
+    assert 503 in retry.status_forcelist
+    assert retry.raise_on_status is False